@@ -182,6 +182,8 @@ def main():
     # Create shader renderer (platform-aware)
     print("Initializing shader renderer...")
     renderer = ShaderRenderer(args.width, args.height)
+    # Single render + read per frame, so overlap readback with the next frame
+    renderer.async_readback = True
 
     # Load shader
     print(f"Loading shader: {shader_path}")
@@ -330,8 +332,8 @@ def main():
             # Render shader on GPU
             renderer.render()
 
-            # Read pixels from GPU
-            pixels = renderer.read_pixels()
+            # Read pixels from GPU (a view; consumed before the next read)
+            pixels = renderer.read_pixels(copy=False)
 
             # Apply gamma correction if not 1.0
             if args.gamma != 1.0:
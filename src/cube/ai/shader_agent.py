@@ -64,6 +64,8 @@ class ShaderAgent:
 
         # Examples directory (parent of shaders_dir typically)
         self.examples_root = examples_root or shaders_dir.parent
+        # Example code read for prompts: path -> (mtime_ns, truncated code)
+        self._example_cache: Dict[Path, Tuple[int, str]] = {}
 
         # Validation renderer for compilation testing
         self.validation_renderer = validation_renderer
@@ -543,10 +545,7 @@ class ShaderAgent:
 
         for score, shader_path in scored_shaders[:max_examples]:
             try:
-                code = shader_path.read_text()
-                # Truncate very long shaders
-                if len(code) > 2000:
-                    code = code[:2000] + "\n// ... (truncated)"
+                code = self._read_example(shader_path)
                 examples.append((shader_path.name, code))
                 print(f"Found example: {shader_path.name} (score: {score})")
             except Exception as e:
@@ -557,22 +556,38 @@ class ShaderAgent:
             basic_examples = ['sphere.glsl', 'torus.glsl', 'pyramid.glsl']
             for name in basic_examples:
                 for search_dir in search_dirs:
-                    path = search_dir / name
-                    if path.exists():
-                        try:
-                            code = path.read_text()
-                            if len(code) > 2000:
-                                code = code[:2000] + "\n// ... (truncated)"
-                            examples.append((name, code))
-                            print(f"Using basic example: {name}")
-                            break
-                        except Exception:
-                            pass
+                    try:
+                        # _read_example stats the file anyway, so no exists() check first
+                        code = self._read_example(search_dir / name)
+                    except Exception:
+                        continue
+                    examples.append((name, code))
+                    print(f"Using basic example: {name}")
+                    break
                 if len(examples) >= max_examples:
                     break
 
         return examples
 
+    def _read_example(self, shader_path: Path) -> str:
+        """
+        Read an example shader for a prompt, truncating very long ones.
+
+        Examples are re-read only when the file changes, so repeated
+        generations don't hit the disk for the same examples.
+        """
+        mtime_ns = shader_path.stat().st_mtime_ns
+        cached = self._example_cache.get(shader_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        code = shader_path.read_text()
+        # Truncate very long shaders
+        if len(code) > 2000:
+            code = code[:2000] + "\n// ... (truncated)"
+        self._example_cache[shader_path] = (mtime_ns, code)
+        return code
+
     def _build_generation_prompt(self, examples: list = None) -> str:
         """
         Build system prompt for initial shader generation.
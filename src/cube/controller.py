@@ -478,8 +478,9 @@ class CubeController:
         if self.unified_renderer and self.current_shader_path:
             print(f"Reloading shader: {self.current_shader_path}")
             try:
+                # Keep rendering the old version while the edit compiles
                 self.unified_renderer.load_shader(
-                    str(self.current_shader_path))
+                    str(self.current_shader_path), wait=False)
             except Exception as e:
                 print(f"Error reloading shader: {e}")
 
@@ -13,6 +13,36 @@ import time
 from typing import Optional, Dict
 from .keyboard import Keyboard, KeyboardState
 
+# Bytes drained from the terminal per poll
+_READ_SIZE = 256
+
+# Arrow key escape sequences as ((sequence, key), ...) groups checked in
+# order, each with whether it implies shift
+_ARROW_SEQUENCES = (
+    # Shift+Arrow (terminal sends different codes), e.g. Shift+Up: ESC[1;2A
+    ((('\x1b[1;2A', 'up'), ('\x1b[1;2B', 'down'),
+      ('\x1b[1;2C', 'right'), ('\x1b[1;2D', 'left')), True),
+    # Full escape sequences
+    ((('\x1b[A', 'up'), ('\x1b[B', 'down'),
+      ('\x1b[C', 'right'), ('\x1b[D', 'left')), False),
+    # Partial escape sequences (ESC consumed by terminal)
+    ((('[A', 'up'), ('[B', 'down'), ('[C', 'right'), ('[D', 'left')), False),
+)
+
+# Exact inputs -> (key name, shift held). Other printable characters are
+# passed through as their own key name.
+_SPECIAL_KEYS = {
+    # Uppercase letters indicate shift is held
+    'W': ('w', True), 'S': ('s', True), 'A': ('a', True), 'D': ('d', True),
+    'E': ('e', True), 'C': ('c', True), 'M': ('m', True), 'N': ('n', True),
+    # Z key - alternate shift modifier for SSH (easier to detect)
+    'z': ('shift', True), 'Z': ('shift', True),
+    '\r': ('enter', False), '\n': ('enter', False),
+    ' ': ('space', False),  # Space character (ASCII 32)
+    '\x1b': ('escape', False),  # Bare ESC
+    '\x7f': ('backspace', False),
+}
+
 
 class SSHKeyboard(Keyboard):
     """
@@ -66,19 +96,13 @@ class SSHKeyboard(Keyboard):
         Returns:
             String of all characters read, or None if no input available
         """
-        chars = ''
+        # stdin is non-blocking, so one read drains everything pending (a
+        # whole escape sequence at once) instead of one call per character
         try:
-            while True:
-                try:
-                    c = sys.stdin.read(1)
-                    if c:
-                        chars += c
-                    else:
-                        break
-                except (IOError, OSError):
-                    break
-        except Exception:
-            pass
+            chars = os.read(self.stdin_fd, _READ_SIZE).decode('utf-8', errors='replace')
+        except (IOError, OSError):
+            # BlockingIOError when nothing is pending
+            chars = ''
 
         # Debug: Print what we received (uncomment for debugging)
         # if chars:
@@ -105,132 +129,21 @@ class SSHKeyboard(Keyboard):
         if '\x03' in chars:
             return 'ctrl-c'
 
-        # Check for Shift+Arrow escape sequences (terminal sends different codes)
-        # Shift+Up: ESC[1;2A
-        if '\x1b[1;2A' in chars:
-            self._shift_held = True
-            return 'up'
-        elif '\x1b[1;2B' in chars:
-            self._shift_held = True
-            return 'down'
-        elif '\x1b[1;2C' in chars:
-            self._shift_held = True
-            return 'right'
-        elif '\x1b[1;2D' in chars:
-            self._shift_held = True
-            return 'left'
-
-        # Check for regular arrow key escape sequences
-        # Full escape sequences
-        if '\x1b[A' in chars:
-            return 'up'
-        elif '\x1b[B' in chars:
-            return 'down'
-        elif '\x1b[C' in chars:
-            return 'right'
-        elif '\x1b[D' in chars:
-            return 'left'
-
-        # Partial escape sequences (ESC consumed by terminal)
-        elif '[A' in chars:
-            return 'up'
-        elif '[B' in chars:
-            return 'down'
-        elif '[C' in chars:
-            return 'right'
-        elif '[D' in chars:
-            return 'left'
-
-        # Single character keys
-        # WASD navigation
-        if chars == 'w':
-            return 'w'
-        elif chars == 's':
-            return 's'
-        elif chars == 'a':
-            return 'a'
-        elif chars == 'd':
-            return 'd'
-
-        # Uppercase WASD (indicates shift is held)
-        elif chars == 'W':
-            self._shift_held = True
-            return 'w'
-        elif chars == 'S':
-            self._shift_held = True
-            return 's'
-        elif chars == 'A':
-            self._shift_held = True
-            return 'a'
-        elif chars == 'D':
-            self._shift_held = True
-            return 'd'
-
-        # Z key - alternate shift modifier for SSH (easier to detect)
-        elif chars == 'z' or chars == 'Z':
-            self._shift_held = True
-            return 'shift'  # Return 'shift' as the key press
-
-        # Special keys
-        elif chars == '\r' or chars == '\n':
-            return 'enter'
-        elif chars == ' ' or chars == '\x20':  # Space character (ASCII 32)
-            return 'space'
-        elif chars == '\x1b':  # Bare ESC
-            return 'escape'
-        elif chars == '\x7f':  # Backspace
-            return 'backspace'
-
-        # Letter keys
-        elif chars == 'b':
-            return 'b'
-        elif chars == 'q':
-            return 'q'
-        elif chars == 'r':
-            return 'r'
-        elif chars == 'e':
-            return 'e'
-        elif chars == 'c':
-            return 'c'
-        elif chars == 't':
-            return 't'
-        elif chars == 'm':
-            return 'm'
-        elif chars == 'n':
-            return 'n'
-        elif chars == 'i':
-            return 'i'
-
-        # Uppercase letter keys (shift held)
-        elif chars == 'E':
-            self._shift_held = True
-            return 'e'
-        elif chars == 'C':
-            self._shift_held = True
-            return 'c'
-        elif chars == 'M':
-            self._shift_held = True
-            return 'm'
-        elif chars == 'N':
-            self._shift_held = True
-            return 'n'
-
-        # MIDI control punctuation keys
-        elif chars == ',':
-            return ','
-        elif chars == '.':
-            return '.'
-        elif chars == '[':
-            return '['
-        elif chars == ']':
-            return ']'
-        elif chars == ';':
-            return ';'
-        elif chars == "'":
-            return "'"
+        # Escape sequences can arrive with other bytes, so match substrings
+        for sequences, shifted in _ARROW_SEQUENCES:
+            for seq, key in sequences:
+                if seq in chars:
+                    self._shift_held = shifted
+                    return key
+
+        # Single keys that map to another name or imply shift
+        special = _SPECIAL_KEYS.get(chars)
+        if special is not None:
+            key, self._shift_held = special
+            return key
 
         # Number keys
-        elif chars in '0123456789':
+        if chars in '0123456789':
             return chars
 
         # Catch-all: Pass through any single printable character for text input
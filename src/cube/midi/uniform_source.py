@@ -6,9 +6,14 @@ available to shaders just like keyboard, audio, etc.
 """
 
 from typing import Dict, Any
+
+import numpy as np
+
 from cube.shader.uniform_sources import UniformSource
 from .midi_state import MIDIState
 
+_PARAM_NAMES = ('iParam0', 'iParam1', 'iParam2', 'iParam3')
+
 
 class MIDIUniformSource(UniformSource):
     """
@@ -32,6 +37,8 @@ class MIDIUniformSource(UniformSource):
         }
     """
 
+    __slots__ = ('_params', '_uniforms', 'midi_state')
+
     def __init__(self, midi_state: MIDIState):
         """
         Initialize MIDI uniform source.
@@ -41,6 +48,10 @@ class MIDIUniformSource(UniformSource):
         """
         self.midi_state = midi_state
 
+        # One dict reused every frame; iParams is updated in place
+        self._params = np.zeros(4, dtype=np.float32)
+        self._uniforms = {'iParams': self._params}
+
     def update(self, dt: float):
         """
         Update MIDI uniforms (no-op, state is updated externally).
@@ -55,21 +66,15 @@ class MIDIUniformSource(UniformSource):
         Get current MIDI parameter values as shader uniforms.
 
         Returns:
-            Dictionary with iParam0-3 (floats) and iParams (vec4 tuple)
+            Dictionary with iParam0-3 (floats) and iParams (vec4 array),
+            shared and updated in place
         """
-        # Get normalized values (0.0-1.0)
-        param0 = self.midi_state.get_normalized(0)
-        param1 = self.midi_state.get_normalized(1)
-        param2 = self.midi_state.get_normalized(2)
-        param3 = self.midi_state.get_normalized(3)
-
-        return {
-            'iParam0': param0,
-            'iParam1': param1,
-            'iParam2': param2,
-            'iParam3': param3,
-            'iParams': (param0, param1, param2, param3),
-        }
+        uniforms = self._uniforms
+        params = self._params
+        for i, name in enumerate(_PARAM_NAMES):
+            # Normalized values (0.0-1.0)
+            uniforms[name] = params[i] = self.midi_state.get_normalized(i)
+        return uniforms
 
     def cleanup(self):
         """No cleanup needed for MIDI uniform source."""
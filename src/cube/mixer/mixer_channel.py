@@ -72,21 +72,23 @@ class MixerChannel:
 
     def _activate_context(self):
         """Activate this channel's OpenGL context (for GLUT multi-context support)."""
-        # Check if this is a GLUT renderer with a window
-        if hasattr(self.shader_renderer, 'glut_window') and self.shader_renderer.glut_window is not None:
-            try:
-                from OpenGL.GLUT import glutSetWindow
-                glutSetWindow(self.shader_renderer.glut_window)
-            except Exception as e:
-                # If context switching fails, continue anyway (may work)
-                pass
+        # Only GLUT renderers need this; EGL renderers switch contexts themselves.
+        # Failures are reported there and rendering continues anyway (may work)
+        if getattr(self.shader_renderer, 'glut_window', None) is not None:
+            self.shader_renderer.make_context_current()
+
+    def read_pixels(self, copy: bool = True):
+        """
+        Read rendered pixels from this channel.
 
-    def read_pixels(self):
-        """Read rendered pixels from this channel."""
+        Args:
+            copy: Return an independent array; with False the result is a
+                view valid only until this channel's next read
+        """
         if self.shader_renderer is not None:
             # Activate this renderer's OpenGL context if it's a GLUT renderer
             self._activate_context()
-            return self.shader_renderer.read_pixels()
+            return self.shader_renderer.read_pixels(copy)
         return None
 
     def cleanup(self):
@@ -39,17 +39,20 @@ class MixerRenderer:
         # Get the active pair
         left_channel, right_channel = state.get_active_pair()
 
+        # Each channel has its own renderer and readback buffers, and the
+        # crossfade below produces a new array, so read without copying
+
         # Get left channel output
         left_pixels = None
         if left_channel.has_shader():
             left_channel.render()
-            left_pixels = left_channel.read_pixels()
+            left_pixels = left_channel.read_pixels(copy=False)
 
         # Get right channel output
         right_pixels = None
         if right_channel.has_shader():
             right_channel.render()
-            right_pixels = right_channel.read_pixels()
+            right_pixels = right_channel.read_pixels(copy=False)
 
         # Crossfade between channels
         return self._crossfade(left_pixels, right_pixels, state.crossfader)
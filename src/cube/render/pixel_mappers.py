@@ -135,6 +135,19 @@ class CubePixelMapper(PixelMapper):
             face_index: Index of the face to render (0-5)
             camera_source: CameraUniformSource to temporarily override
         """
+        # Temporarily override the camera vectors for this render pass
+        camera_source.set_override_vectors(self.get_face_camera_vectors(face_index))
+
+    def get_face_camera_vectors(self, face_index: int) -> tuple:
+        """
+        Get the camera vectors for viewing from a specific face.
+
+        Args:
+            face_index: Index of the face to render (0-5)
+
+        Returns:
+            (pos, right, up, forward) tuple for the current rotation/zoom
+        """
         face_name = self.active_faces[face_index]
         config = self.FACE_CONFIGS[face_name]
 
@@ -144,10 +157,7 @@ class CubePixelMapper(PixelMapper):
 
         # Create a temporary StaticCamera to compute the proper view vectors
         temp_camera = StaticCamera(pos, look_at)
-        vectors = temp_camera.get_vectors()
-
-        # Temporarily override the camera vectors for this render pass
-        camera_source.set_override_vectors(vectors)
+        return temp_camera.get_vectors()
 
     def _compute_camera_position(self, face_name: str, config: dict) -> tuple:
         """
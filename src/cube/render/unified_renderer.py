@@ -6,14 +6,49 @@ All rendering logic (shaders, uniforms, input) is shared. Only the
 pixel mapping (how renders map to output) varies.
 """
 
+from typing import Dict, Any
+
 import numpy as np
-from OpenGL.GL import glViewport, glUniform3f, glUniform1f, glUseProgram
 
 from cube.shader import ShaderRenderer, UniformSource
 from cube.shader.camera_uniform_source import CameraUniformSource
 from .pixel_mappers import PixelMapper
 
 
+class SettingsUniformSource(UniformSource):
+    """
+    Provides debug uniforms from the renderer settings dictionary.
+
+    Uniforms provided:
+    - iDebugAxes (float): 1.0 when the 'debug_axes' setting is enabled
+    """
+
+    __slots__ = ('_uniforms', 'settings')
+
+    def __init__(self, settings: dict):
+        """
+        Initialize settings uniform source.
+
+        Args:
+            settings: Settings dictionary (read live every frame)
+        """
+        self.settings = settings
+        self._uniforms = {'iDebugAxes': 0.0}
+
+    def update(self, dt: float):
+        """No-op, settings are read when uniforms are requested."""
+        pass
+
+    def get_uniforms(self) -> Dict[str, Any]:
+        """Get debug uniforms from current settings (shared dict, updated in place)."""
+        self._uniforms['iDebugAxes'] = 1.0 if self.settings.get('debug_axes', False) else 0.0
+        return self._uniforms
+
+    def cleanup(self):
+        """No cleanup needed for settings."""
+        pass
+
+
 class UnifiedRenderer:
     """
     Unified shader renderer with pluggable pixel mapping.
@@ -38,18 +73,37 @@ class UnifiedRenderer:
         max_width = max(spec.width for spec in specs)
         max_height = max(spec.height for spec in specs)
 
+        # Same-sized per-face passes are tiled side by side into one
+        # framebuffer: one frame of uniforms, one clear and one readback
+        self.tile_count = 0
+        if (len(specs) > 1 and hasattr(pixel_mapper, 'get_face_camera_vectors')
+                and all(spec.width == max_width and spec.height == max_height for spec in specs)):
+            self.tile_count = len(specs)
+            self.tile_width = max_width
+
         # Create GPU renderer
-        self.gpu_renderer = ShaderRenderer(max_width, max_height)
+        if self.tile_count:
+            self.gpu_renderer = ShaderRenderer(max_width * self.tile_count, max_height)
+        else:
+            self.gpu_renderer = ShaderRenderer(max_width, max_height)
         self.current_width = max_width
         self.current_height = max_height
 
+        # With one render and one read per frame, collect each frame while the
+        # next is drawn (PBO ring, one frame of latency). Untiled multi-pass
+        # rendering reads several passes per frame and must stay synchronous.
+        self.gpu_renderer.async_readback = bool(self.tile_count) or len(specs) == 1
+
         # Register ALL uniform sources in one place
         # 1. Camera source (ALWAYS created here - single source of truth)
         mapper_camera = getattr(pixel_mapper, 'camera', None)
         self.camera_source = CameraUniformSource(camera=mapper_camera)
         self.gpu_renderer.add_uniform_source(self.camera_source)
 
-        # 2. Additional uniform sources (MIDI, audio, etc.)
+        # 2. Debug uniforms driven by settings
+        self.gpu_renderer.add_uniform_source(SettingsUniformSource(self.settings))
+
+        # 3. Additional uniform sources (MIDI, audio, etc.)
         # Filter out any CameraUniformSource from external sources to avoid duplicates
         if uniform_sources:
             for source in uniform_sources:
@@ -73,9 +127,9 @@ class UnifiedRenderer:
         """
         return self.gpu_renderer.make_context_current()
 
-    def load_shader(self, shader_path: str):
-        """Load shader file."""
-        self.gpu_renderer.load_shader(shader_path)
+    def load_shader(self, shader_path: str, wait: bool = True):
+        """Load shader file (see ShaderRendererBase.load_shader for wait)."""
+        self.gpu_renderer.load_shader(shader_path, wait=wait)
 
     def add_input_source(self, source: UniformSource):
         """Add input source (audio, MIDI, etc.)."""
@@ -92,6 +146,9 @@ class UnifiedRenderer:
         Returns:
             Final framebuffer ready for display
         """
+        if self.tile_count:
+            return self._render_tiled()
+
         render_specs = self.pixel_mapper.get_render_specs()
         renders = []
 
@@ -105,16 +162,10 @@ class UnifiedRenderer:
             if spec.width != self.current_width or spec.height != self.current_height:
                 self._resize_viewport(spec.width, spec.height)
 
-            # Set debug uniforms if available
-            if hasattr(self.gpu_renderer, 'program') and self.gpu_renderer.program:
-                glUseProgram(self.gpu_renderer.program)
-                if hasattr(self.gpu_renderer, 'uniform_locs') and 'iDebugAxes' in self.gpu_renderer.uniform_locs:
-                    debug_value = 1.0 if self.settings.get('debug_axes', False) else 0.0
-                    glUniform1f(self.gpu_renderer.uniform_locs['iDebugAxes'], debug_value)
-
             # Render this pass
             self.gpu_renderer.render()
-            pixels = self.gpu_renderer.read_pixels()
+            # A lone pass is consumed before the next read, so it can stay a view
+            pixels = self.gpu_renderer.read_pixels(copy=len(render_specs) > 1)
             renders.append(pixels)
 
         # Clear camera override after all faces rendered
@@ -124,22 +175,38 @@ class UnifiedRenderer:
         # Layout all renders into final framebuffer
         return self.pixel_mapper.layout_renders(renders)
 
+    def _render_tiled(self) -> np.ndarray:
+        """Render every face in one framebuffer and split the single readback."""
+        tile_uniforms = []
+        for i in range(self.tile_count):
+            pos, right, up, forward = self.pixel_mapper.get_face_camera_vectors(i)
+            tile_uniforms.append({
+                'iCameraPos': pos,
+                'iCameraRight': right,
+                'iCameraUp': up,
+                'iCameraForward': forward,
+            })
+
+        self.gpu_renderer.render_tiles(self.tile_width, tile_uniforms)
+        # layout_renders copies the tiles out, so the readback buffer can be viewed directly
+        pixels = self.gpu_renderer.read_pixels(copy=False)
+
+        # Tiles are side by side, so each face is a column slice (a view)
+        return self.pixel_mapper.layout_renders(np.hsplit(pixels, self.tile_count))
+
     def _resize_viewport(self, width: int, height: int):
         """Resize GPU renderer viewport."""
+        # Imported here so OpenGL loads only after the renderer picked its platform
+        from OpenGL.GL import glViewport
+
         self.gpu_renderer.width = width
         self.gpu_renderer.height = height
         self.current_width = width
         self.current_height = height
 
+        # iResolution follows width/height with the next frame's uniforms
         glViewport(0, 0, width, height)
 
-        # Update iResolution uniform
-        if hasattr(self.gpu_renderer, 'uniform_locs') and 'iResolution' in self.gpu_renderer.uniform_locs:
-            glUniform3f(
-                self.gpu_renderer.uniform_locs['iResolution'],
-                float(width), float(height), 1.0
-            )
-
     def cleanup(self):
         """Clean up GPU resources."""
         self.gpu_renderer.cleanup()
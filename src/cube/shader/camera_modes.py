@@ -5,7 +5,6 @@ Provides different camera control schemes (spherical, FPS, etc.) with a
 unified interface.
 """
 
-import time
 import math
 from abc import ABC, abstractmethod
 from typing import Tuple, Dict
@@ -18,9 +17,7 @@ class CameraMode(ABC):
     Each mode handles input and computes camera vectors differently.
     """
 
-    def __init__(self):
-        """Initialize camera mode."""
-        self.last_update_time = time.time()
+    __slots__ = ()
 
     @abstractmethod
     def update(self, input_state: Dict[str, float], dt: float, shift_pressed: bool = False):
@@ -68,6 +65,13 @@ class SphericalCamera(CameraMode):
     - Frame-rate independent
     """
 
+    __slots__ = (
+        'damping', 'distance', 'distance_vel', 'initial_distance',
+        'initial_pitch', 'initial_roll', 'initial_yaw', 'max_distance',
+        'min_distance', 'pitch', 'pitch_vel', 'roll', 'roll_vel',
+        'rotate_speed', 'yaw', 'yaw_vel', 'zoom_speed',
+    )
+
     def __init__(
         self,
         distance: float = 12.0,
@@ -247,6 +251,11 @@ class StaticCamera(CameraMode):
     - Viewing non-3D effects
     """
 
+    __slots__ = (
+        '_forward', '_pos', '_right', '_up', 'initial_look_at',
+        'initial_position', 'look_at', 'position',
+    )
+
     def __init__(
         self,
         position: Tuple[float, float, float] = (0.0, 0.0, -5.0),
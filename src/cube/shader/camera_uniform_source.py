@@ -7,6 +7,7 @@ as MIDI, audio, keyboard, etc. This eliminates special-case camera handling.
 
 from typing import Dict, Any
 import time
+import numpy as np
 from .uniform_sources import UniformSource
 from .camera_modes import CameraMode, SphericalCamera
 
@@ -24,6 +25,11 @@ class CameraUniformSource(UniformSource):
     The camera updates based on input state set via set_key_state().
     """
 
+    __slots__ = (
+        '_override_active', '_override_arr', '_uniforms', 'camera',
+        'input_state', 'last_update_time', 'shift_pressed',
+    )
+
     def __init__(self, camera: CameraMode = None):
         """
         Initialize camera uniform source.
@@ -42,7 +48,7 @@ class CameraUniformSource(UniformSource):
             )
 
         self.camera = camera
-        self.last_update_time = time.time()
+        self.last_update_time = time.perf_counter()
 
         # Input state (updated by controller via set_key_state)
         self.input_state = {
@@ -56,8 +62,13 @@ class CameraUniformSource(UniformSource):
 
         self.shift_pressed = False
 
-        # Temporary override for multi-pass rendering (e.g., cube faces)
-        self._override_vectors = None
+        # Temporary override for multi-pass rendering (e.g., cube faces).
+        # Rows are pos, right, up, forward.
+        self._override_arr = np.empty((4, 3), dtype=np.float32)
+        self._override_active = False
+
+        # Returned every frame and refreshed in place
+        self._uniforms = {}
 
     def set_key_state(self, key: str, pressed: bool):
         """
@@ -81,10 +92,12 @@ class CameraUniformSource(UniformSource):
         Args:
             dt: Delta time since last update
         """
-        # Update camera from input state
-        current_time = time.time()
-        dt = current_time - self.last_update_time
-        self.last_update_time = current_time
+        # Trust the renderer's frame clock; only fall back to our own timer
+        # for legacy callers that don't supply a delta
+        if dt <= 0:
+            current_time = time.perf_counter()
+            dt = current_time - self.last_update_time
+            self.last_update_time = current_time
 
         # Clamp dt to prevent huge jumps
         if dt > 0.1:
@@ -96,21 +109,24 @@ class CameraUniformSource(UniformSource):
         """
         Get camera position and orientation vectors as uniforms.
 
+        The four vectors land in adjacent slots of the renderer's uniform
+        block, so they reach the GPU in its single per-frame upload.
+
         Returns:
-            Dictionary with camera uniforms
+            Dictionary with camera uniforms - shared, updated in place
         """
         # Use override vectors if set (for multi-pass rendering)
-        if self._override_vectors is not None:
-            pos, right, up, forward = self._override_vectors
+        if self._override_active:
+            pos, right, up, forward = self._override_arr
         else:
             pos, right, up, forward = self.camera.get_vectors()
 
-        return {
-            'iCameraPos': pos,
-            'iCameraRight': right,
-            'iCameraUp': up,
-            'iCameraForward': forward,
-        }
+        uniforms = self._uniforms
+        uniforms['iCameraPos'] = pos
+        uniforms['iCameraRight'] = right
+        uniforms['iCameraUp'] = up
+        uniforms['iCameraForward'] = forward
+        return uniforms
 
     def set_override_vectors(self, vectors):
         """
@@ -119,7 +135,11 @@ class CameraUniformSource(UniformSource):
         Args:
             vectors: (pos, right, up, forward) tuple or None to clear override
         """
-        self._override_vectors = vectors
+        if vectors is None:
+            self._override_active = False
+        else:
+            self._override_arr[:] = vectors
+            self._override_active = True
 
     def get_camera(self) -> CameraMode:
         """Get the underlying camera instance."""
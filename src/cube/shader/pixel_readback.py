@@ -0,0 +1,177 @@
+"""
+Framebuffer readback through a ring of pixel pack buffers (PBOs).
+
+glReadPixels into client memory blocks until the GPU has finished the
+frame. Reading into a pixel pack buffer instead queues an asynchronous DMA
+copy, so with two buffers the CPU can collect frame N-1 while frame N is
+still being transferred.
+
+When buffer storage is available the buffers are mapped persistently once
+and completion is tracked with fences; otherwise each collect maps the
+buffer briefly and copies into a preallocated frame.
+"""
+
+import ctypes
+
+import numpy as np
+from OpenGL.error import GLError
+from OpenGL.GL import *
+from OpenGL.raw.GL.VERSION.GL_1_0 import glReadPixels as glReadPixelsRaw
+
+
+class PixelReadback:
+    """
+    Ring of pixel pack buffers for framebuffer readback.
+
+    Requires the owning renderer's OpenGL context to be current for every call.
+    """
+
+    def __init__(self, gl_format: int, channels: int, num_buffers: int = 2):
+        """
+        Initialize pixel readback.
+
+        Args:
+            gl_format: Readback pixel format (e.g. GL_RGBA, GL_RGB)
+            channels: Bytes per pixel for gl_format
+            num_buffers: Number of pack buffers in the ring
+        """
+        self.gl_format = gl_format
+        self.channels = channels
+        self.num_buffers = num_buffers
+
+        try:
+            extensions = glGetString(GL_EXTENSIONS) or b''
+        except GLError:
+            # Core profiles no longer report extensions through glGetString
+            extensions = b''
+        self.persistent = b'_buffer_storage' in extensions and bool(glBufferStorage)
+        self.map_range = bool(glMapBufferRange)
+
+        self.width = 0
+        self.height = 0
+        self.pbos: list[int] = []
+        self.views: list[np.ndarray | None] = []
+        self.fences: list[int | None] = []
+        self.queued: list[bool] = []
+        self.frame = None
+        self.index = 0
+
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+
+    def _allocate(self, width: int, height: int):
+        """(Re)allocate pack buffers for the given frame size."""
+        self.release()
+
+        self.width = width
+        self.height = height
+        nbytes = width * height * self.channels
+        shape = (height, width, self.channels)
+
+        self.pbos = [int(pbo) for pbo in np.atleast_1d(glGenBuffers(self.num_buffers))]
+        self.views = [None] * self.num_buffers
+        self.fences = [None] * self.num_buffers
+        self.queued = [False] * self.num_buffers
+        self.frame = np.empty(shape, dtype=np.uint8)
+        self.index = 0
+
+        map_flags = GL_MAP_READ_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+
+        for i, pbo in enumerate(self.pbos):
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, pbo)
+            if self.persistent:
+                # Map once; glReadPixels then writes straight into this memory
+                glBufferStorage(GL_PIXEL_PACK_BUFFER, nbytes, None, map_flags | GL_CLIENT_STORAGE_BIT)
+                ptr = glMapBufferRange(GL_PIXEL_PACK_BUFFER, 0, nbytes, map_flags)
+                self.views[i] = np.ctypeslib.as_array(
+                    (ctypes.c_ubyte * nbytes).from_address(ptr)
+                ).reshape(shape)
+            else:
+                glBufferData(GL_PIXEL_PACK_BUFFER, nbytes, None, GL_STREAM_READ)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+    def _queue(self, index: int):
+        """Start an asynchronous copy of the bound framebuffer into a pack buffer."""
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self.pbos[index])
+        glReadPixelsRaw(0, 0, self.width, self.height, self.gl_format,
+                        GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+        if self.persistent:
+            if self.fences[index] is not None:
+                # A synchronous read in between left this copy uncollected
+                glDeleteSync(self.fences[index])
+            self.fences[index] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+        self.queued[index] = True
+
+    def _collect(self, index: int) -> np.ndarray:
+        """Wait for a queued copy to finish and return its pixels."""
+        self.queued[index] = False
+
+        if self.persistent:
+            fence = self.fences[index]
+            glClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, GL_TIMEOUT_IGNORED)
+            glDeleteSync(fence)
+            self.fences[index] = None
+            return self.views[index]
+
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self.pbos[index])
+        if self.map_range:
+            ptr = glMapBufferRange(GL_PIXEL_PACK_BUFFER, 0, self.frame.nbytes, GL_MAP_READ_BIT)
+        else:
+            # Legacy desktop contexts (GL 2.1) only have whole-buffer mapping
+            ptr = glMapBuffer(GL_PIXEL_PACK_BUFFER, GL_READ_ONLY)
+        ctypes.memmove(self.frame.ctypes.data, ptr, self.frame.nbytes)
+        glUnmapBuffer(GL_PIXEL_PACK_BUFFER)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        return self.frame
+
+    def read(self, width: int, height: int, asynchronous: bool = False) -> np.ndarray:
+        """
+        Read the bound framebuffer.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+            asynchronous: Return the previously queued frame (one frame of
+                latency) instead of waiting for the current one
+
+        Returns:
+            Array of shape (height, width, channels) in framebuffer row
+            order (bottom row first). The array is reused by later reads.
+        """
+        if width != self.width or height != self.height:
+            self._allocate(width, height)
+
+        current = self.index
+        previous = (current - 1) % self.num_buffers
+        self.index = (current + 1) % self.num_buffers
+
+        if not asynchronous:
+            self._queue(current)
+            return self._collect(current)
+
+        if not self.queued[previous]:
+            # Prime the ring so a copy is always in flight from now on
+            self._queue(previous)
+        self._queue(current)
+        return self._collect(previous)
+
+    def release(self):
+        """
+        Delete pack buffers and pending fences.
+
+        Objects are deleted by name, so the owning context must be current:
+        in another context the same names belong to someone else.
+        """
+        for fence in self.fences:
+            if fence is not None:
+                glDeleteSync(fence)
+        if self.pbos:
+            # Deleting a buffer also unmaps it
+            self.views = []
+            glDeleteBuffers(len(self.pbos), self.pbos)
+        self.pbos = []
+        self.fences = []
+        self.queued = []
+        self.width = 0
+        self.height = 0
@@ -0,0 +1,392 @@
+"""
+Persistent cache of linked OpenGL program binaries.
+
+Compiling the Shadertoy-wrapped fragment shader from source dominates
+renderer start-up and shader switching. This module stores the driver's
+linked program binary on disk (via glGetProgramBinary) and restores it on
+later runs with glProgramBinary, falling back to a normal compile whenever
+the cache misses or the driver rejects the stored binary.
+
+Cache entries are keyed by a hash of the shader sources plus the GL vendor,
+renderer and version strings, so driver upgrades invalidate them naturally.
+Edited and generated shaders keep adding entries, so the oldest are pruned
+whenever the cache outgrows its size limit.
+
+Cache misses can also be built without blocking: begin_program() submits
+the compile and link, and where the driver supports parallel shader
+compilation (KHR/ARB_parallel_shader_compile) is_complete() can be polled
+each frame until finish_program() will return without stalling.
+"""
+
+import ctypes
+import hashlib
+import os
+import struct
+import time
+from pathlib import Path
+
+from OpenGL.error import GLError, NullFunctionError
+from OpenGL.GL import *
+from OpenGL.raw.GL.VERSION.GL_4_1 import glGetProgramBinary as glGetProgramBinaryRaw
+from OpenGL.raw.GL.VERSION.GL_4_1 import glProgramBinary as glProgramBinaryRaw
+
+# Default on-disk cache location
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'cube' / 'shaders'
+
+# Default limit on the total size of cached binaries
+DEFAULT_MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+# Temporary files older than this were left by a writer that died mid-write
+_STALE_TMP_NS = 60 * 1_000_000_000
+
+# Vertex attribute location bound to the fullscreen triangle's 'position' input
+POSITION_ATTRIB_LOCATION = 0
+
+# Binary file header: program binary format (GLenum)
+_HEADER = struct.Struct('<I')
+
+# GL_COMPLETION_STATUS_KHR (same value as the ARB extension's enum)
+_COMPLETION_STATUS = 0x91B1
+
+# Let the driver pick its number of compiler threads
+_MAX_COMPILER_THREADS = 0xFFFFFFFF
+
+
+class PendingProgram:
+    """A program submitted to the driver whose link may not have finished."""
+
+    __slots__ = ('fragment_shader', 'from_binary', 'path', 'program', 'vertex_shader')
+
+    def __init__(self, program: int, vertex_shader: int = 0, fragment_shader: int = 0,
+                 path: Path | None = None, from_binary: bool = False):
+        self.program = program
+        # The vertex shader is shared (owned by ProgramCache); the fragment
+        # shader belongs to this program and is deleted once it has linked
+        self.vertex_shader = vertex_shader
+        self.fragment_shader = fragment_shader
+        self.path = path
+        self.from_binary = from_binary
+
+
+def _decode_log(log) -> str:
+    """Decode a GL info log into text."""
+    if isinstance(log, bytes):
+        return log.decode('utf-8', errors='replace')
+    return log
+
+
+class ProgramCache:
+    """
+    Compiles shader programs, reusing linked binaries cached on disk.
+
+    Requires a current OpenGL context for every call.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        """
+        Initialize program cache.
+
+        Args:
+            cache_dir: Directory for cached program binaries
+            max_bytes: Total size of cached binaries to keep; the oldest
+                are deleted once a new binary takes the cache past it
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._driver_id = None
+        self._enabled = None
+        self._parallel = None
+        # Compiled vertex shaders by source; the pass-through vertex shader
+        # is the same for every program, so it is compiled only once
+        self._vertex_shaders = {}
+
+    def _is_enabled(self) -> bool:
+        """Check (once) whether the driver supports program binaries."""
+        if self._enabled is None:
+            try:
+                self._enabled = glGetIntegerv(GL_NUM_PROGRAM_BINARY_FORMATS) > 0
+            except (GLError, NullFunctionError):
+                # Enum unknown to the context (e.g. legacy desktop GL)
+                self._enabled = False
+            if not self._enabled:
+                print("Program binaries not supported - shader binary cache disabled")
+        return self._enabled
+
+    def _is_parallel(self) -> bool:
+        """Check (once) for parallel shader compilation and enable its threads."""
+        if self._parallel is None:
+            try:
+                extensions = glGetString(GL_EXTENSIONS) or b''
+            except GLError:
+                # Core profiles no longer report extensions through glGetString
+                extensions = b''
+            self._parallel = b'_parallel_shader_compile' in extensions
+            if self._parallel:
+                try:
+                    from OpenGL.GL.KHR.parallel_shader_compile import (
+                        glMaxShaderCompilerThreadsKHR,
+                    )
+                    glMaxShaderCompilerThreadsKHR(_MAX_COMPILER_THREADS)
+                except (ImportError, GLError, NullFunctionError) as e:
+                    # Drivers default to using their worker threads anyway
+                    print(f"Could not set shader compiler threads ({e}), using driver default")
+        return self._parallel
+
+    def _get_driver_id(self) -> bytes:
+        """Get the GL vendor/renderer/version identity for cache keys."""
+        if self._driver_id is None:
+            parts = [glGetString(name) or b'' for name in (GL_VENDOR, GL_RENDERER, GL_VERSION)]
+            self._driver_id = b'\0'.join(parts)
+        return self._driver_id
+
+    def cache_key(self, vertex_source: str, fragment_source: str) -> str:
+        """Hash shader sources and driver identity into a cache key."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(self._get_driver_id())
+        digest.update(b'\0')
+        digest.update(vertex_source.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(fragment_source.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _load_binary(self, path: Path) -> int | None:
+        """Create a program from a cached binary, or None if unusable."""
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if len(data) <= _HEADER.size:
+            return None
+
+        (binary_format,) = _HEADER.unpack_from(data)
+        blob = data[_HEADER.size:]
+        buffer = (ctypes.c_ubyte * len(blob)).from_buffer_copy(blob)
+
+        program = glCreateProgram()
+        glProgramBinaryRaw(program, binary_format, buffer, len(blob))
+
+        if glGetProgramiv(program, GL_LINK_STATUS) != GL_TRUE:
+            # Driver rejected the binary (e.g. after an update) - discard it
+            glDeleteProgram(program)
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+        return program
+
+    def _store_binary(self, path: Path, program: int):
+        """Write a linked program's binary to disk atomically."""
+        length = glGetProgramiv(program, GL_PROGRAM_BINARY_LENGTH)
+        if length <= 0:
+            return
+
+        buffer = (ctypes.c_ubyte * length)()
+        written = GLsizei(0)
+        binary_format = GLenum(0)
+        glGetProgramBinaryRaw(
+            program, length, ctypes.byref(written), ctypes.byref(binary_format), buffer
+        )
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_HEADER.pack(binary_format.value))
+                f.write(memoryview(buffer)[:written.value])
+            os.replace(tmp_path, path)
+        except OSError:
+            # Don't leave partial files behind (e.g. when the SD card is full)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+
+        self._prune()
+
+    def _prune(self):
+        """
+        Delete the oldest cached binaries until the cache fits max_bytes.
+
+        Temporary files abandoned by interrupted writes are deleted too.
+        """
+        stale_before = time.time_ns() - _STALE_TMP_NS
+        for path in self.cache_dir.glob('*.tmp'):
+            try:
+                if path.stat().st_mtime_ns < stale_before:
+                    path.unlink()
+            except OSError:
+                continue
+
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob('*.bin'):
+            try:
+                stat = path.stat()
+            except OSError:
+                # Removed by another process meanwhile
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def _submit(self, vertex_source: str, fragment_source: str, retrievable: bool) -> PendingProgram:
+        """Submit compile and link from source without querying their status."""
+        vertex_shader = self._vertex_shaders.get(vertex_source)
+        if vertex_shader is None:
+            vertex_shader = self._submit_shader(vertex_source, GL_VERTEX_SHADER)
+            self._vertex_shaders[vertex_source] = vertex_shader
+        fragment_shader = self._submit_shader(fragment_source, GL_FRAGMENT_SHADER)
+
+        program = glCreateProgram()
+        glAttachShader(program, vertex_shader)
+        glAttachShader(program, fragment_shader)
+        glBindAttribLocation(program, POSITION_ATTRIB_LOCATION, b"position")
+        if retrievable:
+            glProgramParameteri(program, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
+        glLinkProgram(program)
+
+        return PendingProgram(program, vertex_shader, fragment_shader)
+
+    def _submit_shader(self, source: str, shader_type: int) -> int:
+        """Create a shader object and submit its source for compilation."""
+        shader = glCreateShader(shader_type)
+        glShaderSource(shader, source)
+        glCompileShader(shader)
+        return shader
+
+    def begin_program(self, vertex_source: str, fragment_source: str,
+                      key: str | None = None) -> PendingProgram:
+        """
+        Start building a program for the given sources.
+
+        Cached binaries are restored immediately; otherwise the sources are
+        submitted to the driver, which may compile them in the background.
+
+        Args:
+            vertex_source: Complete vertex shader source
+            fragment_source: Complete fragment shader source
+            key: cache_key() of the sources, if the caller already has it
+
+        Returns:
+            Pending program to pass to is_complete() / finish_program()
+        """
+        self._is_parallel()
+
+        if not self._is_enabled():
+            return self._submit(vertex_source, fragment_source, retrievable=False)
+
+        if key is None:
+            key = self.cache_key(vertex_source, fragment_source)
+        path = self.cache_dir / f"{key}.bin"
+
+        try:
+            program = self._load_binary(path)
+        except (OSError, GLError) as e:
+            print(f"Warning: Failed to load cached shader binary {path.name}: {e}")
+            program = None
+
+        if program is not None:
+            return PendingProgram(program, path=path, from_binary=True)
+
+        pending = self._submit(vertex_source, fragment_source, retrievable=True)
+        pending.path = path
+        return pending
+
+    def is_complete(self, pending: PendingProgram) -> bool:
+        """
+        Check whether finish_program() can return without blocking.
+
+        Without parallel compilation support the driver gives no way to
+        ask, so this reports True and the wait happens in finish_program().
+        """
+        if pending.from_binary or not self._is_parallel():
+            return True
+        return bool(glGetProgramiv(pending.program, _COMPLETION_STATUS))
+
+    def finish_program(self, pending: PendingProgram) -> int:
+        """
+        Wait for a pending program and check that it linked.
+
+        Args:
+            pending: Program returned by begin_program()
+
+        Returns:
+            OpenGL program handle
+
+        Raises:
+            RuntimeError: If compilation or linking fails
+        """
+        program = pending.program
+        if pending.from_binary:
+            return program
+
+        linked = glGetProgramiv(program, GL_LINK_STATUS) == GL_TRUE
+
+        error = None
+        if not linked:
+            # Report the first shader that failed to compile, else the link log
+            for shader in (pending.vertex_shader, pending.fragment_shader):
+                if glGetShaderiv(shader, GL_COMPILE_STATUS) != GL_TRUE:
+                    error = f"Shader compile failure: {_decode_log(glGetShaderInfoLog(shader))}"
+                    if shader == pending.vertex_shader:
+                        self._drop_vertex_shader(shader)
+                    break
+            else:
+                error = f"Link failure: {_decode_log(glGetProgramInfoLog(program))}"
+
+        # The fragment shader is owned by the program once linked
+        self._release_fragment_shader(pending)
+
+        if error is not None:
+            glDeleteProgram(program)
+            raise RuntimeError(error)
+
+        if pending.path is not None:
+            try:
+                self._store_binary(pending.path, program)
+            except (OSError, GLError) as e:
+                print(f"Warning: Failed to cache shader binary: {e}")
+
+        return program
+
+    def _release_fragment_shader(self, pending: PendingProgram):
+        """Delete a pending program's own fragment shader."""
+        if pending.fragment_shader:
+            glDeleteShader(pending.fragment_shader)
+            pending.fragment_shader = 0
+
+    def _drop_vertex_shader(self, shader: int):
+        """Forget and delete a cached vertex shader."""
+        for source, cached in list(self._vertex_shaders.items()):
+            if cached == shader:
+                del self._vertex_shaders[source]
+        glDeleteShader(shader)
+
+    def cancel_program(self, pending: PendingProgram):
+        """Discard a pending program that is no longer wanted."""
+        self._release_fragment_shader(pending)
+        glDeleteProgram(pending.program)
+
+    def release(self):
+        """
+        Delete the cached vertex shaders.
+
+        The shaders belong to the renderer's context, which must be current.
+        """
+        for shader in self._vertex_shaders.values():
+            glDeleteShader(shader)
+        self._vertex_shaders.clear()
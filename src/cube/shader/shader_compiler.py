@@ -6,52 +6,21 @@ that can be used by both the renderer and the AI agent.
 """
 
 import traceback
+from functools import cache
 from pathlib import Path
 from typing import Tuple, Optional
 
-try:
-    from OpenGL.GL import *
-    from OpenGL.GL import shaders
-    OPENGL_AVAILABLE = True
-except ImportError:
-    OPENGL_AVAILABLE = False
 
-
-def wrap_shadertoy_shader(fragment_source: str, glsl_version: str = "120",
-                          precision_statement: str = "") -> Tuple[str, str]:
-    """
-    Wrap a Shadertoy-format shader with uniforms and helper functions.
-
-    Args:
-        fragment_source: Raw shader source code (must contain mainImage function)
-        glsl_version: GLSL version string (e.g., "120", "300 es", "330 core")
-        precision_statement: Precision statement for mobile (e.g., "precision mediump float;")
-
-    Returns:
-        Tuple of (vertex_source, fragment_wrapped)
-    """
-    # Determine if we're using modern GLSL (ES 3.00+ or desktop 3.30+)
-    is_modern = glsl_version not in ["100", "120"]
-
-    # Modern GLSL uses 'in'/'out', legacy uses 'attribute'/'varying'
-    attribute_keyword = "in" if is_modern else "attribute"
-
-    vertex_source = f"""#version {glsl_version}
+# Vertex shader template - only the version and attribute keyword vary
+_VERT_TEMPLATE = """#version {glsl_version}
 {attribute_keyword} vec2 position;
 void main() {{
     gl_Position = vec4(position, 0.0, 1.0);
 }}
 """
 
-    # Modern GLSL requires explicit output declaration
-    frag_output_decl = "out vec4 fragColor;" if is_modern else ""
-    frag_color_target = "fragColor" if is_modern else "gl_FragColor"
-
-    # Modern GLSL has texture() built-in, legacy needs texture2D()
-    texture_define = "" if is_modern else "#define texture texture2D"
-
-    # Modern GLSL has tanh() and round() built-in, legacy needs polyfills
-    helper_functions = "" if is_modern else """
+# Legacy GLSL lacks tanh() and round() built-ins, so provide polyfills
+_LEGACY_HELPER_FUNCTIONS = """
 float tanh(float x) {
     float e = exp(2.0 * x);
     return (e - 1.0) / (e + 1.0);
@@ -89,47 +58,189 @@ vec4 round(vec4 x) {
 }
 """
 
-    fragment_wrapped = f"""#version {glsl_version}
+# Per-frame uniforms shared through a std140 uniform block on modern GLSL.
+# Entries are (name, GLSL type, offset in 4-byte words); vec3s are padded
+# out by a trailing scalar so the whole block packs into 12 vec4 slots.
+UNIFORM_BLOCK_NAME = "ShaderGlobals"
+UNIFORM_BLOCK_BINDING = 0
+UNIFORM_BLOCK_LAYOUT = (
+    ('iResolution', 'vec3', 0),
+    ('iTime', 'float', 3),
+    ('iMouse', 'vec4', 4),
+    ('iInput', 'vec4', 8),
+    ('iCameraPos', 'vec3', 12),
+    ('iTimeDelta', 'float', 15),
+    ('iCameraRight', 'vec3', 16),
+    ('iBPM', 'float', 19),
+    ('iCameraUp', 'vec3', 20),
+    ('iBeatPhase', 'float', 23),
+    ('iCameraForward', 'vec3', 24),
+    ('iBeatPulse', 'float', 27),
+    ('iAudioSpectrum', 'vec4', 28),
+    ('iParams', 'vec4', 32),
+    ('iAudioLevel', 'float', 36),
+    ('iDebugAxes', 'float', 37),
+    ('iParam0', 'float', 38),
+    ('iParam1', 'float', 39),
+    ('iParam2', 'float', 40),
+    ('iParam3', 'float', 41),
+    ('iFrame', 'int', 42),
+    ('iTileOrigin', 'vec2', 44),
+)
+UNIFORM_BLOCK_WORDS = 48
+
+_SAMPLER_DECLARATIONS = "\n".join(f"uniform sampler2D iChannel{i};" for i in range(4))
+
+# Legacy GLSL has no uniform blocks, so the same layout is emulated with one
+# vec4 array (a single glUniform4fv per frame); defines map each name onto
+# its components. Integers are stored as floats on this path.
+UNIFORM_ARRAY_NAME = "iGlobals"
+UNIFORM_ARRAY_VEC4S = UNIFORM_BLOCK_WORDS // 4
+
+_SWIZZLES = 'xyzw'
+_TYPE_WIDTHS = {'vec2': 2, 'vec3': 3, 'vec4': 4}
+
+
+def _legacy_uniform_define(name: str, type_: str, offset: int) -> str:
+    """Define a uniform block member as a view into the legacy vec4 array."""
+    index, component = divmod(offset, 4)
+    width = _TYPE_WIDTHS.get(type_, 1)
+    expr = f"{UNIFORM_ARRAY_NAME}[{index}]"
+    if width < 4:
+        expr += "." + _SWIZZLES[component:component + width]
+    if type_ == 'int':
+        expr = f"int({expr})"
+    return f"#define {name} ({expr})"
+
+
+_LEGACY_UNIFORM_DECLARATIONS = "\n".join(
+    [f"uniform vec4 {UNIFORM_ARRAY_NAME}[{UNIFORM_ARRAY_VEC4S}];"]
+    + [_legacy_uniform_define(name, type_, offset) for name, type_, offset in UNIFORM_BLOCK_LAYOUT]
+    + [_SAMPLER_DECLARATIONS]
+)
+
+# Anonymous block: members keep their bare names, so shaders need no changes
+_BLOCK_UNIFORM_DECLARATIONS = "\n".join(
+    [f"layout(std140) uniform {UNIFORM_BLOCK_NAME} {{"]
+    + [f"    {type_} {name};" for name, type_, _ in UNIFORM_BLOCK_LAYOUT]
+    + ["};", _SAMPLER_DECLARATIONS]
+)
+
+# Fragment shader prologue with all Shadertoy-style uniform declarations.
+# The user's mainImage source is spliced between prologue and epilogue.
+_FRAG_PROLOGUE_TEMPLATE = """#version {glsl_version}
 {precision_statement}
 {frag_output_decl}
-uniform vec3 iResolution;
-uniform float iTime;
-uniform float iTimeDelta;
-uniform int iFrame;
-uniform vec4 iMouse;
-uniform vec4 iInput;
-uniform sampler2D iChannel0;
-uniform sampler2D iChannel1;
-uniform sampler2D iChannel2;
-uniform sampler2D iChannel3;
-uniform vec3 iCameraPos;
-uniform vec3 iCameraRight;
-uniform vec3 iCameraUp;
-uniform vec3 iCameraForward;
-uniform float iBPM;
-uniform float iBeatPhase;
-uniform float iBeatPulse;
-uniform float iAudioLevel;
-uniform vec4 iAudioSpectrum;
-uniform float iDebugAxes;
-uniform float iParam0;
-uniform float iParam1;
-uniform float iParam2;
-uniform float iParam3;
-uniform vec4 iParams;
+{uniform_declarations}
+
+// Tile-local gl_FragCoord: shaders that read gl_FragCoord directly see the
+// same coordinates as mainImage's fragCoord, also in tiled renders
+{frag_coord_type} cubeFragCoord;
+#define gl_FragCoord cubeFragCoord
 
 {texture_define}
 {helper_functions}
-{fragment_source}
+"""
 
+_FRAG_EPILOGUE_TEMPLATE = """
+#undef gl_FragCoord
 void main() {{
-    mainImage({frag_color_target}, gl_FragCoord.xy);
+    // iTileOrigin is zero outside tiled renders
+    cubeFragCoord = vec4(gl_FragCoord.xy - iTileOrigin, gl_FragCoord.zw);
+    mainImage({frag_color_target}, cubeFragCoord.xy);
 }}
 """
 
+# GLSL versions that predate in/out qualifiers, texture() and uniform blocks
+_LEGACY_GLSL_VERSIONS = frozenset({"100", "120"})
+
+# Template values that differ between modern (ES 3.00+ / 3.30+) and legacy GLSL
+_MODERN_DEFAULTS = {
+    'attribute_keyword': 'in',
+    'frag_output_decl': 'out vec4 fragColor;',
+    'frag_color_target': 'fragColor',
+    # gl_FragCoord is highp; a mediump default could not hold wide frames
+    'frag_coord_type': 'highp vec4',
+    'uniform_declarations': _BLOCK_UNIFORM_DECLARATIONS,
+    'texture_define': '',
+    'helper_functions': '',
+}
+
+_LEGACY_DEFAULTS = {
+    'attribute_keyword': 'attribute',
+    'frag_output_decl': '',
+    'frag_color_target': 'gl_FragColor',
+    'frag_coord_type': 'vec4',
+    'uniform_declarations': _LEGACY_UNIFORM_DECLARATIONS,
+    'texture_define': '#define texture texture2D',
+    'helper_functions': _LEGACY_HELPER_FUNCTIONS,
+}
+
+
+def is_modern_glsl(glsl_version: str) -> bool:
+    """Check whether a GLSL version supports in/out and uniform blocks (ES 3.00+ / 3.30+)."""
+    return glsl_version not in _LEGACY_GLSL_VERSIONS
+
+
+@cache
+def _wrapper_parts(glsl_version: str, precision_statement: str) -> Tuple[str, str, str]:
+    """Render the source-independent wrapper pieces once per GLSL version."""
+    values = dict(_MODERN_DEFAULTS if is_modern_glsl(glsl_version) else _LEGACY_DEFAULTS)
+    values['glsl_version'] = glsl_version
+    values['precision_statement'] = precision_statement
+
+    return (
+        _VERT_TEMPLATE.format_map(values),
+        _FRAG_PROLOGUE_TEMPLATE.format_map(values),
+        _FRAG_EPILOGUE_TEMPLATE.format_map(values),
+    )
+
+
+def wrap_shadertoy_shader(fragment_source: str, glsl_version: str = "120",
+                          precision_statement: str = "") -> Tuple[str, str]:
+    """
+    Wrap a Shadertoy-format shader with uniforms and helper functions.
+
+    Args:
+        fragment_source: Raw shader source code (must contain mainImage function)
+        glsl_version: GLSL version string (e.g., "120", "300 es", "330 core")
+        precision_statement: Precision statement for mobile (e.g., "precision mediump float;")
+
+    Returns:
+        Tuple of (vertex_source, fragment_wrapped)
+    """
+    vertex_source, prologue, epilogue = _wrapper_parts(glsl_version, precision_statement)
+    fragment_wrapped = f"{prologue}{fragment_source}{epilogue}"
+
     return vertex_source, fragment_wrapped
 
 
+def _validation_gl():
+    """
+    Get OpenGL for the compile checks below, if they can run.
+
+    OpenGL is imported on first use: it is slow to import and must not be
+    loaded before the renderer has chosen its platform (EGL/GLUT).
+
+    Returns:
+        Tuple of (OpenGL.GL module or None, reason validation is skipped)
+    """
+    try:
+        import OpenGL.GL.shaders
+    except ImportError:
+        return None, "OpenGL not available - skipping validation"
+
+    GL = OpenGL.GL
+    # Fails or returns None without a current context
+    try:
+        version = GL.glGetString(GL.GL_VERSION)
+    except Exception:
+        version = None
+    if version is None:
+        return None, "No active OpenGL context - skipping validation"
+    return GL, ""
+
+
 def test_shader_compilation(shader_path: Path, glsl_version: str = "120",
                             precision_statement: str = "") -> Tuple[bool, str]:
     """
@@ -148,20 +259,9 @@ def test_shader_compilation(shader_path: Path, glsl_version: str = "120",
         - has_errors: True if compilation failed
         - output: Error message if failed, success message otherwise
     """
-    if not OPENGL_AVAILABLE:
-        return False, "OpenGL not available - skipping validation"
-
-    # Check if we have an active OpenGL context
-    try:
-        # Try to get the current context - this will fail if no context exists
-        from OpenGL.GL import glGetString, GL_VERSION
-        version = glGetString(GL_VERSION)
-        if version is None:
-            # No active context
-            return False, "No active OpenGL context - skipping validation"
-    except Exception:
-        # No context available
-        return False, "No active OpenGL context - skipping validation"
+    GL, skip_reason = _validation_gl()
+    if GL is None:
+        return False, skip_reason
 
     try:
         # Read shader source
@@ -174,14 +274,14 @@ def test_shader_compilation(shader_path: Path, glsl_version: str = "120",
 
         # Try to compile
         try:
-            vertex_shader = shaders.compileShader(vertex_source, GL_VERTEX_SHADER)
-            fragment_shader = shaders.compileShader(fragment_wrapped, GL_FRAGMENT_SHADER)
-            program = shaders.compileProgram(vertex_shader, fragment_shader)
+            vertex_shader = GL.shaders.compileShader(vertex_source, GL.GL_VERTEX_SHADER)
+            fragment_shader = GL.shaders.compileShader(fragment_wrapped, GL.GL_FRAGMENT_SHADER)
+            program = GL.shaders.compileProgram(vertex_shader, fragment_shader)
 
             # Cleanup
-            glDeleteProgram(program)
-            glDeleteShader(vertex_shader)
-            glDeleteShader(fragment_shader)
+            GL.glDeleteProgram(program)
+            GL.glDeleteShader(vertex_shader)
+            GL.glDeleteShader(fragment_shader)
 
             return False, "Shader compiled successfully"
 
@@ -224,20 +324,9 @@ def test_shader_source_compilation(fragment_source: str, glsl_version: str = "12
         - has_errors: True if compilation failed
         - output: Error message if failed, success message otherwise
     """
-    if not OPENGL_AVAILABLE:
-        return False, "OpenGL not available - skipping validation"
-
-    # Check if we have an active OpenGL context
-    try:
-        # Try to get the current context - this will fail if no context exists
-        from OpenGL.GL import glGetString, GL_VERSION
-        version = glGetString(GL_VERSION)
-        if version is None:
-            # No active context
-            return False, "No active OpenGL context - skipping validation"
-    except Exception:
-        # No context available
-        return False, "No active OpenGL context - skipping validation"
+    GL, skip_reason = _validation_gl()
+    if GL is None:
+        return False, skip_reason
 
     try:
         # Wrap shader
@@ -247,14 +336,14 @@ def test_shader_source_compilation(fragment_source: str, glsl_version: str = "12
 
         # Try to compile
         try:
-            vertex_shader = shaders.compileShader(vertex_source, GL_VERTEX_SHADER)
-            fragment_shader = shaders.compileShader(fragment_wrapped, GL_FRAGMENT_SHADER)
-            program = shaders.compileProgram(vertex_shader, fragment_shader)
+            vertex_shader = GL.shaders.compileShader(vertex_source, GL.GL_VERTEX_SHADER)
+            fragment_shader = GL.shaders.compileShader(fragment_wrapped, GL.GL_FRAGMENT_SHADER)
+            program = GL.shaders.compileProgram(vertex_shader, fragment_shader)
 
             # Cleanup
-            glDeleteProgram(program)
-            glDeleteShader(vertex_shader)
-            glDeleteShader(fragment_shader)
+            GL.glDeleteProgram(program)
+            GL.glDeleteShader(vertex_shader)
+            GL.glDeleteShader(fragment_shader)
 
             return False, "Shader compiled successfully"
 
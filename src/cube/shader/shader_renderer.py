@@ -9,6 +9,12 @@ shader renderer implementation:
 Both implementations provide offscreen rendering suitable for compositing
 into a display system (e.g., cube_control.py).
 
+The platform modules (and with them OpenGL, which is slow to import on the
+Raspberry Pi) are only imported when a renderer is actually created. This
+also lets the EGL renderer select PyOpenGL's EGL platform before OpenGL is
+first imported, so keep OpenGL imports out of module scope in code that is
+loaded before a renderer exists.
+
 Usage:
     from piomatter.shader.shader_renderer import ShaderRenderer
     
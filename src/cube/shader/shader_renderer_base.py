@@ -6,17 +6,123 @@ implementations (pygame for MacOS, EGL for Raspberry Pi).
 """
 
 import time
+from collections import OrderedDict
 import numpy as np
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
 from OpenGL.GL import *
-from OpenGL.GL import shaders
 
 from .camera_modes import CameraMode, SphericalCamera
 from .uniform_sources import UniformSourceManager, KeyboardUniformSource, UniformSource
-from .shader_compiler import wrap_shadertoy_shader
+from .shader_compiler import (
+    wrap_shadertoy_shader, is_modern_glsl,
+    UNIFORM_BLOCK_NAME, UNIFORM_BLOCK_BINDING, UNIFORM_BLOCK_LAYOUT, UNIFORM_BLOCK_WORDS,
+    UNIFORM_ARRAY_NAME, UNIFORM_ARRAY_VEC4S
+)
+from .program_cache import ProgramCache, POSITION_ATTRIB_LOCATION
+from .pixel_readback import PixelReadback
+
+# Shader files read from disk: resolved path -> (mtime_ns, wrapped), where
+# wrapped maps (GLSL version, precision statement) to the program cache key,
+# vertex source and wrapped fragment source. Every renderer in a process
+# uses the same GL platform and driver, so renderers share the keys too.
+_SHADER_SOURCE_CACHE = {}
+
+# Linked programs kept per renderer for switching back without a relink
+_MAX_LOADED_PROGRAMS = 8
+
+# Uniform block (or legacy vec4 array) slots: name -> (word offset, component count, is_int)
+_UNIFORM_BLOCK_SLOTS = {
+    name: (offset, {'vec2': 2, 'vec3': 3, 'vec4': 4}.get(type_, 1), type_ == 'int')
+    for name, type_, offset in UNIFORM_BLOCK_LAYOUT
+}
+
+# Readback format -> RGB channel slice of its pixels
+_RGB_CHANNELS = {
+    GL_RGB: slice(0, 3),
+    GL_RGBA: slice(0, 3),
+    GL_BGRA: slice(2, None, -1),
+}
+
+
+def _make_uniform_setter(gl_type: int, loc: int):
+    """
+    Build a setter uploading a value to a uniform of the given GL type.
+
+    Resolved once per program so per-frame uploads skip type inspection.
+    Vectors accept tuples/lists or float32 arrays (uploaded without boxing).
+    Uniform values persist in the program, so the setter skips values equal
+    to the last one it uploaded; arrays may be updated in place by their
+    source and are always uploaded.
+    """
+    if gl_type == GL_FLOAT:
+        set_scalar = glUniform1f
+    elif gl_type in (GL_INT, GL_BOOL, GL_SAMPLER_2D):
+        set_scalar = glUniform1i
+    else:
+        set_scalar = None
+
+    if set_scalar is not None:
+        last = None
+
+        def set_value(value):
+            nonlocal last
+            if value != last:
+                set_scalar(loc, value)
+                last = value
+
+        return set_value
+
+    vector_functions = {
+        GL_FLOAT_VEC2: (glUniform2f, glUniform2fv),
+        GL_FLOAT_VEC3: (glUniform3f, glUniform3fv),
+        GL_FLOAT_VEC4: (glUniform4f, glUniform4fv),
+    }.get(gl_type)
+    if vector_functions is None:
+        return None
+
+    set_components, set_array = vector_functions
+    last_components = None
+
+    def set_vector(value):
+        nonlocal last_components
+        if type(value) is np.ndarray:
+            set_array(loc, 1, value)
+            last_components = None
+        elif value != last_components:
+            set_components(loc, *value)
+            last_components = value
+
+    return set_vector
+
+
+def _make_block_writer(floats: np.ndarray, ints: np.ndarray, offset: int, size: int, is_int: bool):
+    """
+    Build a writer storing a value into a uniform block slot.
+
+    Vector slots write through a view sliced once here rather than per frame.
+    """
+    if is_int:
+        def write_int(value):
+            ints[offset] = value
+
+        return write_int
+
+    if size == 1:
+        def write_float(value):
+            floats[offset] = value
+
+        return write_float
+
+    view = floats[offset:offset + size]
+
+    def write_vector(value):
+        view[:] = value
+
+    return write_vector
+
 
 class ShaderRendererBase(ABC):
     """
@@ -51,19 +157,63 @@ class ShaderRendererBase(ABC):
         self.width = width
         self.height = height
         self.scale = scale
-        self.start_time = time.time()
+        # Integer nanosecond clock; converted to seconds only where needed
+        self.start_ns = time.perf_counter_ns()
         self.frame_count = 0
-        self.last_fps_time = self.start_time
+        self.last_frame_elapsed = 0.0
+        self.last_fps_ns = self.start_ns
+        self.frame_ns = self.start_ns
         self.fps = 0.0
         self.fps_frames = 0
         
         # Uniform manager - handles ALL uniforms (camera, keyboard, MIDI, audio, etc.)
         self.uniform_manager = UniformSourceManager()
+        # Refilled every frame rather than reallocated
+        self._uniform_cache = {}
         
         self.program = None
         self.vbo = None
+        self.vao = None
         self.uniform_locs = {}
+        self.uniform_setters = {}
+        # Per-frame dispatch for the current program: uniform name -> writer
+        # (block slot or per-program setter), rebuilt whenever it changes
+        self.uniform_writers = {}
+        self._block_writers = {}
+        self.ubo = None
+        # Per-tile uniform blocks for render_tiles(): one buffer uploaded once
+        # per frame, each tile drawn with its own range bound
+        self.tile_ubo = None
+        self._tile_block_data = None
+        self._tile_block_stride = 0
+        self.uniform_array_loc = -1
+        # Per-frame uniform values in block layout. Modern GLSL uploads them
+        # as a UBO; legacy GLSL as one vec4 array (with integers as floats).
+        self.uniform_data = np.zeros(UNIFORM_BLOCK_WORDS, dtype=np.float32)
+        self.uniform_ints = self.uniform_data
         self.textures = {}
+        # Uploaded textures reused across shader loads: (path, mtime_ns) -> texture id
+        self._texture_cache = {}
+        self.program_cache = ProgramCache()
+        self.readback = None
+        # When True, read_pixels returns the previous frame (one frame of
+        # latency) so readback overlaps the next render. Only suitable when
+        # each render() is followed by exactly one read_pixels().
+        self.async_readback = False
+        # The fullscreen triangle writes every pixel, so clearing first is
+        # wasted bandwidth. Enable for shaders that discard fragments.
+        self.clear_before_draw = False
+        # Programs linked in this context, least recently used first:
+        # cache key -> (program, uniform_locs, uniform_setters)
+        self.loaded_programs = OrderedDict()
+        # Cache key of the program last loaded from each file: resolved path -> key
+        self._program_keys = {}
+        # Shader compiling in the background: (cache key, PendingProgram, path)
+        self.pending_shader = None
+        # GL binding state last set through this renderer, to skip no-op rebinds.
+        # Only valid while nothing else changes these bindings in our context.
+        self._current_program = 0
+        self._bound_buffers = {}
         
         self._init_context()
         
@@ -71,7 +221,18 @@ class ShaderRendererBase(ABC):
         glDisable(GL_DEPTH_TEST)
         glDisable(GL_DITHER)
         
-        self._create_fullscreen_quad()
+        self._create_fullscreen_triangle()
+        self.readback = PixelReadback(*self._get_readback_format())
+        # RGB channels of a readback pixel, in order (a view, never a copy)
+        self.rgb_channels = _RGB_CHANNELS[self.readback.gl_format]
+
+        if is_modern_glsl(self._get_glsl_version()):
+            self._create_uniform_buffer()
+
+        self._block_writers = {
+            name: _make_block_writer(self.uniform_data, self.uniform_ints, *slot)
+            for name, slot in _UNIFORM_BLOCK_SLOTS.items()
+        }
     
     @abstractmethod
     def _init_context(self):
@@ -123,6 +284,16 @@ class ShaderRendererBase(ABC):
         """
         return "precision mediump float;"
 
+    def _get_readback_format(self) -> Tuple[int, int]:
+        """
+        Get the (GL pixel format, channel count) used for readback.
+
+        Desktop GL stores color as BGRA8, so reading BGRA avoids a
+        per-pixel conversion in the driver; read_pixels() reorders the
+        channels with a view. Override where BGRA readback is not supported.
+        """
+        return GL_BGRA, 4
+
     def handle_events(self) -> bool:
         """
         Handle platform-specific events (optional, for window lifecycle).
@@ -135,26 +306,91 @@ class ShaderRendererBase(ABC):
         """
         return True
     
-    def _create_fullscreen_quad(self):
-        """Create fullscreen quad for shader rendering."""
+    def _create_fullscreen_triangle(self):
+        """Create fullscreen triangle for shader rendering."""
+        # One oversized triangle covers clip space and is clipped to the
+        # viewport; unlike a two-triangle quad, no fragments along the
+        # diagonal get shaded twice
         vertices = np.array([
             -1.0, -1.0,
-            1.0, -1.0,
-            -1.0, 1.0,
-            1.0, 1.0,
+            3.0, -1.0,
+            -1.0, 3.0,
         ], dtype=np.float32)
         
         self.vbo = glGenBuffers(1)
-        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        self._bind_buffer(GL_ARRAY_BUFFER, self.vbo)
         glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+
+        # Programs bind 'position' to a fixed location, so the attribute setup
+        # is done once for every shader: captured in a VAO on modern contexts,
+        # or left enabled in the default vertex state on legacy ones (nothing
+        # else in this context touches vertex attributes)
+        if is_modern_glsl(self._get_glsl_version()):
+            self.vao = glGenVertexArrays(1)
+            glBindVertexArray(self.vao)
+            glEnableVertexAttribArray(POSITION_ATTRIB_LOCATION)
+            glVertexAttribPointer(POSITION_ATTRIB_LOCATION, 2, GL_FLOAT, GL_FALSE, 0, None)
+            glBindVertexArray(0)
+        else:
+            glEnableVertexAttribArray(POSITION_ATTRIB_LOCATION)
+            glVertexAttribPointer(POSITION_ATTRIB_LOCATION, 2, GL_FLOAT, GL_FALSE, 0, None)
+    
+    def _use_program(self, program: int):
+        """Make a program current, skipping the call if it already is."""
+        if program != self._current_program:
+            glUseProgram(program)
+            self._current_program = program
+
+    def _bind_buffer(self, target: int, buffer: int):
+        """Bind a buffer to a target, skipping the call if it already is."""
+        if self._bound_buffers.get(target) != buffer:
+            glBindBuffer(target, buffer)
+            self._bound_buffers[target] = buffer
+
+    def _create_uniform_buffer(self):
+        """Create the uniform buffer backing the per-frame uniform block."""
+        # std140 integers are stored as raw int32 bits
+        self.uniform_ints = self.uniform_data.view(np.int32)
+
+        self.ubo = glGenBuffers(1)
+        self._bind_buffer(GL_UNIFORM_BUFFER, self.ubo)
+        glBufferData(GL_UNIFORM_BUFFER, self.uniform_data.nbytes, None, GL_DYNAMIC_DRAW)
+        glBindBufferBase(GL_UNIFORM_BUFFER, UNIFORM_BLOCK_BINDING, self.ubo)
+
+        # Tile blocks share one buffer, each starting at an aligned offset
+        alignment = int(glGetIntegerv(GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT))
+        block_bytes = self.uniform_data.nbytes
+        self._tile_block_stride = -(-block_bytes // alignment) * alignment
+
+    def _ensure_tile_blocks(self, count: int) -> np.ndarray:
+        """Get staging for count tile uniform blocks, (re)allocating the tile buffer."""
+        data = self._tile_block_data
+        if data is None or data.shape[0] != count:
+            stride_words = self._tile_block_stride // self.uniform_data.itemsize
+            data = np.zeros((count, stride_words), dtype=np.float32)
+            self._tile_block_data = data
+
+            if self.tile_ubo is None:
+                self.tile_ubo = glGenBuffers(1)
+            self._bind_buffer(GL_UNIFORM_BUFFER, self.tile_ubo)
+            glBufferData(GL_UNIFORM_BUFFER, data.nbytes, None, GL_DYNAMIC_DRAW)
+        return data
     
     def _load_texture(self, image_path: str) -> Optional[int]:
         """Load an image file and create an OpenGL texture."""
         from PIL import Image
         
         try:
-            img = Image.open(image_path).convert('RGB')
-            img_data = np.array(img, dtype=np.uint8)
+            img = Image.open(image_path)
+            # Let JPEG decode straight to RGB at a reduced scale where it can
+            # (draft only affects JPEG and keeps at least the requested size),
+            # then clamp anything still larger than the GPU can hold
+            max_size = int(glGetIntegerv(GL_MAX_TEXTURE_SIZE))
+            img.draft('RGB', (max_size, max_size))
+            img = img.convert('RGB')
+            img.thumbnail((max_size, max_size))
+            # Raw packed RGB bytes upload directly, no per-row numpy conversion
+            img_data = img.tobytes()
             
             texture_id = glGenTextures(1)
             glBindTexture(GL_TEXTURE_2D, texture_id)
@@ -164,11 +400,21 @@ class ShaderRendererBase(ABC):
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
             glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
             
-            glTexImage2D(
-                GL_TEXTURE_2D, 0, GL_RGB,
-                img.width, img.height, 0,
-                GL_RGB, GL_UNSIGNED_BYTE, img_data
-            )
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+            if is_modern_glsl(self._get_glsl_version()) and bool(glTexStorage2D):
+                # Immutable storage: allocated once at its final size and format
+                glTexStorage2D(GL_TEXTURE_2D, 1, GL_RGB8, img.width, img.height)
+                glTexSubImage2D(
+                    GL_TEXTURE_2D, 0, 0, 0,
+                    img.width, img.height,
+                    GL_RGB, GL_UNSIGNED_BYTE, img_data
+                )
+            else:
+                glTexImage2D(
+                    GL_TEXTURE_2D, 0, GL_RGB,
+                    img.width, img.height, 0,
+                    GL_RGB, GL_UNSIGNED_BYTE, img_data
+                )
             
             print(f"Loaded texture: {image_path} ({img.width}×{img.height})")
             return texture_id
@@ -177,11 +423,40 @@ class ShaderRendererBase(ABC):
             print(f"Warning: Failed to load texture {image_path}: {e}")
             return None
     
+    def _get_cached_texture(self, texture_path: Path) -> Optional[int]:
+        """Get a texture for an image file, uploading it only if not already cached."""
+        resolved = str(texture_path.resolve())
+        key = (resolved, texture_path.stat().st_mtime_ns)
+
+        texture_id = self._texture_cache.get(key)
+        if texture_id is not None:
+            return texture_id
+
+        # Drop uploads of older versions of this file
+        stale_ids = [self._texture_cache.pop(k) for k in list(self._texture_cache) if k[0] == resolved]
+        if stale_ids:
+            glDeleteTextures(stale_ids)
+
+        texture_id = self._load_texture(str(texture_path))
+        if texture_id is not None:
+            self._texture_cache[key] = texture_id
+        return texture_id
+
+    def _purge_texture_cache(self):
+        """
+        Delete every texture this renderer has uploaded.
+
+        The cache is per renderer (one per mixer channel), so this only
+        covers this renderer's shaders, current one included. Textures are
+        deleted by name, so this renderer's context must be current.
+        """
+        if self._texture_cache:
+            glDeleteTextures(list(self._texture_cache.values()))
+        self._texture_cache.clear()
+        self.textures.clear()
+
     def _load_shader_textures(self, shader_path: str):
         """Load textures for a shader based on naming convention."""
-        for tex_id in self.textures.values():
-            if tex_id is not None:
-                glDeleteTextures([tex_id])
         self.textures.clear()
         
         shader_dir = Path(shader_path).parent
@@ -191,75 +466,235 @@ class ShaderRendererBase(ABC):
             for ext in ['', '.png', '.jpg', '.jpeg', '.bmp']:
                 texture_path = shader_dir / f"{shader_name}.channel{channel}{ext}"
                 if texture_path.exists():
-                    texture_id = self._load_texture(str(texture_path))
+                    texture_id = self._get_cached_texture(texture_path)
                     if texture_id is not None:
                         self.textures[channel] = texture_id
                     break
-    
-    def load_shader(self, shader_path: str):
-        """Load and compile a Shadertoy-format GLSL shader."""
-        path = Path(shader_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Shader file not found: {path}")
 
-        with open(path, 'r') as f:
-            fragment_source = f.read()
+        # Textures only change with the shader, so bind them here rather than per frame
+        self._bind_textures()
+
+    def _bind_textures(self):
+        """
+        Bind self.textures to their texture units.
 
+        Bindings persist across frames; call this again after changing
+        self.textures outside of load_shader.
+        """
+        for channel in range(4):
+            glActiveTexture(GL_TEXTURE0 + channel)
+            # Unbind unused channels so a previous shader's textures don't leak through
+            glBindTexture(GL_TEXTURE_2D, self.textures.get(channel, 0))
+        glActiveTexture(GL_TEXTURE0)
+    
+    def load_shader(self, shader_path: str, wait: bool = True):
+        """
+        Load and compile a Shadertoy-format GLSL shader.
+
+        Args:
+            shader_path: Path to shader file
+            wait: Block until the program is ready. When False and a shader is
+                already loaded, it keeps rendering while the driver compiles
+                the new one; render() switches over once it is ready, and
+                compile errors are printed instead of raised.
+        """
+        path = Path(shader_path)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Shader file not found: {path}") from None
+
+        # Wrapping and hashing are pure in the file contents, so an unchanged
+        # file reuses the previous result and skips the disk (SD card on the
+        # Pi) entirely; a changed mtime replaces the whole entry
+        cache_key = str(path.resolve())
         glsl_version = self._get_glsl_version()
         precision_statement = self._get_precision_statement()
+        profile = (glsl_version, precision_statement)
+
+        entry = _SHADER_SOURCE_CACHE.get(cache_key)
+        if entry is None or entry[0] != mtime_ns:
+            entry = (mtime_ns, {})
+            _SHADER_SOURCE_CACHE[cache_key] = entry
+
+        wrapped = entry[1].get(profile)
+        if wrapped is None:
+            with open(path, 'r') as f:
+                fragment_source = f.read()
+
+            # Use shared shader wrapping function
+            vertex_source, fragment_wrapped = wrap_shadertoy_shader(
+                fragment_source,
+                glsl_version=glsl_version,
+                precision_statement=precision_statement
+            )
+            key = self.program_cache.cache_key(vertex_source, fragment_wrapped)
+            wrapped = (key, vertex_source, fragment_wrapped)
+            entry[1][profile] = wrapped
+
+        key, vertex_source, fragment_wrapped = wrapped
+
+        # A newer load supersedes any shader still compiling in the background
+        self._cancel_pending_shader()
 
-        # Use shared shader wrapping function
-        vertex_source, fragment_wrapped = wrap_shadertoy_shader(
-            fragment_source,
-            glsl_version=glsl_version,
-            precision_statement=precision_statement
-        )
+        # Reuse a program already linked in this context (e.g. cycling a playlist)
+        cached = self.loaded_programs.get(key)
+
+        if cached is not None:
+            self._activate_program(key, cached[0], shader_path)
+            return
+
+        # Reuses the on-disk program binary when this shader was seen before
+        pending = self.program_cache.begin_program(vertex_source, fragment_wrapped, key)
+
+        if not wait and self.program is not None:
+            self.pending_shader = (key, pending, shader_path)
+            print(f"Compiling shader in background: {shader_path}")
+            return
 
         try:
-            vertex_shader = shaders.compileShader(vertex_source, GL_VERTEX_SHADER)
-            fragment_shader = shaders.compileShader(fragment_wrapped, GL_FRAGMENT_SHADER)
-            self.program = shaders.compileProgram(vertex_shader, fragment_shader)
+            program = self.program_cache.finish_program(pending)
         except RuntimeError as e:
             raise RuntimeError(f"Shader compilation failed: {e}")
-        
-        glUseProgram(self.program)
-
-        # Automatically discover and register all active uniforms in the shader
-        self.uniform_locs = {}
-
-        # Get number of active uniforms
-        num_uniforms = glGetProgramiv(self.program, GL_ACTIVE_UNIFORMS)
 
-        # Query each uniform and register its location
-        for i in range(num_uniforms):
-            name, size, type_ = glGetActiveUniform(self.program, i)
-            # Decode name from bytes to string
-            if isinstance(name, bytes):
-                name = name.decode('utf-8')
-            # Strip null terminator if present
-            name = name.rstrip('\x00')
+        self._activate_program(key, program, shader_path)
 
-            loc = glGetUniformLocation(self.program, name.encode('ascii'))
-            if loc >= 0:
-                self.uniform_locs[name] = loc
+    def _poll_pending_shader(self):
+        """Switch to a background-compiled shader once the driver has finished it."""
+        key, pending, shader_path = self.pending_shader
+        if not self.program_cache.is_complete(pending):
+            return
 
-        print(f"Registered {len(self.uniform_locs)} shader uniforms: {list(self.uniform_locs.keys())}")
+        self.pending_shader = None
+        try:
+            program = self.program_cache.finish_program(pending)
+        except RuntimeError as e:
+            # Keep rendering the previous shader
+            print(f"Shader compilation failed: {e}")
+            return
+
+        self._activate_program(key, program, shader_path)
+
+    def _cancel_pending_shader(self):
+        """Discard a shader still compiling in the background, if any."""
+        if self.pending_shader is not None:
+            self.program_cache.cancel_program(self.pending_shader[1])
+            self.pending_shader = None
+
+    def _activate_program(self, key: str, program: int, shader_path: str):
+        """Make a linked program the current shader and set up its uniforms and textures."""
+        self.program = program
+        self._use_program(program)
+
+        cached = self.loaded_programs.get(key)
+        if cached is not None:
+            _, self.uniform_locs, self.uniform_setters = cached
+            self.loaded_programs.move_to_end(key)
+        else:
+            self.uniform_locs, self.uniform_setters = self._discover_uniforms()
+            self.loaded_programs[key] = (program, self.uniform_locs, self.uniform_setters)
+
+            if self.ubo is not None:
+                block_index = glGetUniformBlockIndex(program, UNIFORM_BLOCK_NAME.encode('ascii'))
+                if block_index != GL_INVALID_INDEX:
+                    glUniformBlockBinding(program, block_index, UNIFORM_BLOCK_BINDING)
+
+        self._retire_programs(str(Path(shader_path).resolve()), key)
+
+        # Resolve each uniform name to its writer once per shader load, so
+        # _set_uniforms is a single lookup and call per value
+        self.uniform_writers = {**self.uniform_setters, **self._block_writers}
+
+        # Array uniforms are reported under their first element's name;
+        # -1 (no legacy array, e.g. with a UBO) is skipped in _set_uniforms
+        self.uniform_array_loc = self.uniform_locs.get(f'{UNIFORM_ARRAY_NAME}[0]', -1)
 
-        if 'iResolution' in self.uniform_locs:
-            glUniform3f(self.uniform_locs['iResolution'],
-                       float(self.width), float(self.height), 1.0)
-        
-        if 'iMouse' in self.uniform_locs:
-            glUniform4f(self.uniform_locs['iMouse'], 0.0, 0.0, 0.0, 0.0)
-        
         for i in range(4):
             channel_name = f'iChannel{i}'
             if channel_name in self.uniform_locs:
                 glUniform1i(self.uniform_locs[channel_name], i)
         
-        self._load_shader_textures(str(path))
+        self._load_shader_textures(str(shader_path))
         
         print(f"Shader loaded: {shader_path}")
+
+    def _retire_programs(self, source_key: str, key: str):
+        """
+        Delete programs that will not be switched back to.
+
+        A file's previous program goes as soon as a reload of it links, and
+        the least recently used programs go once more than
+        _MAX_LOADED_PROGRAMS are kept. The current program is never deleted.
+        """
+        previous = self._program_keys.get(source_key)
+        self._program_keys[source_key] = key
+        if previous is not None and previous not in self._program_keys.values():
+            self._delete_program(previous)
+
+        for stale in list(self.loaded_programs)[:-_MAX_LOADED_PROGRAMS]:
+            self._delete_program(stale)
+
+    def _delete_program(self, key: str):
+        """Delete a linked program and forget it."""
+        entry = self.loaded_programs.get(key)
+        if entry is None or entry[0] == self.program:
+            return
+        del self.loaded_programs[key]
+        glDeleteProgram(entry[0])
+        for source_key in [s for s, k in self._program_keys.items() if k == key]:
+            del self._program_keys[source_key]
+
+    def _delete_programs(self):
+        """Delete every linked program, including the current one."""
+        self._cancel_pending_shader()
+        for program, _, _ in self.loaded_programs.values():
+            glDeleteProgram(program)
+        self.loaded_programs.clear()
+        self._program_keys.clear()
+        self.program = None
+        self._current_program = 0
+
+    def _discover_uniforms(self) -> Tuple[dict, dict]:
+        """
+        Discover all active uniforms in the current program.
+
+        Returns:
+            Tuple of (name -> location, name -> setter) dictionaries
+        """
+        uniform_locs = {}
+        uniform_setters = {}
+
+        # Get number of active uniforms
+        num_uniforms = glGetProgramiv(self.program, GL_ACTIVE_UNIFORMS)
+        indices = range(num_uniforms)
+
+        if self.ubo is not None and num_uniforms:
+            # Block members have no location; find them all in one query
+            # instead of probing each one with glGetUniformLocation
+            uniform_indices = np.arange(num_uniforms, dtype=np.uint32)
+            block_indices = np.empty(num_uniforms, dtype=np.int32)
+            glGetActiveUniformsiv(self.program, num_uniforms, uniform_indices,
+                                  GL_UNIFORM_BLOCK_INDEX, block_indices)
+            indices = np.flatnonzero(block_indices == -1).tolist()
+
+        # Query each uniform and register its location
+        for i in indices:
+            name, size, type_ = glGetActiveUniform(self.program, i)
+            # Keep the raw bytes for the location query; strip any null terminator
+            if isinstance(name, str):
+                name = name.encode('ascii')
+            name = name.rstrip(b'\x00')
+
+            loc = glGetUniformLocation(self.program, name)
+            name = name.decode('ascii')
+            if loc >= 0:
+                uniform_locs[name] = loc
+                setter = _make_uniform_setter(type_, loc)
+                if setter is not None:
+                    uniform_setters[name] = setter
+
+        print(f"Registered {len(uniform_locs)} shader uniforms: {list(uniform_locs.keys())}")
+        return uniform_locs, uniform_setters
     
     def add_uniform_source(self, source: UniformSource):
         """Add an uniform source to the renderer."""
@@ -282,7 +717,7 @@ class ShaderRendererBase(ABC):
         camera_source = self.get_camera_source()
         if camera_source:
             camera_source.camera = camera
-            camera_source.last_update_time = time.time()
+            camera_source.last_update_time = time.perf_counter()
 
     def reset_camera(self):
         """Reset camera to default position."""
@@ -292,79 +727,174 @@ class ShaderRendererBase(ABC):
     
     def render(self):
         """Render one frame of the shader."""
+        uniforms = self._begin_frame()
+
+        self._clear()
+        self._set_uniforms(uniforms)
+        self._draw_fullscreen_triangle()
+
+        self._end_frame()
+
+    def render_tiles(self, tile_width: int, tile_uniforms: List[Dict[str, Any]]):
+        """
+        Render several views of the shader side by side in one frame.
+
+        Each tile is drawn into its own horizontal slice of the framebuffer
+        with its uniform overrides (e.g. per-face camera vectors) applied on
+        top of the frame's shared uniforms. The shader sees tile-local
+        fragCoord, gl_FragCoord and iResolution, so a single read_pixels()
+        returns every tile at once.
+
+        Args:
+            tile_width: Width of each tile in pixels
+            tile_uniforms: One dict of uniform overrides per tile
+        """
+        uniforms = self._begin_frame()
+        uniforms['iResolution'] = (float(tile_width), float(self.height), 1.0)
+
+        self._clear()
+        if self.ubo is not None and all(
+                name in self._block_writers for overrides in tile_uniforms for name in overrides):
+            self._draw_tiles_from_block_ranges(uniforms, tile_width, tile_uniforms)
+        else:
+            for i, overrides in enumerate(tile_uniforms):
+                x = i * tile_width
+                uniforms.update(overrides)
+                uniforms['iTileOrigin'] = (float(x), 0.0)
+                glViewport(x, 0, tile_width, self.height)
+                self._set_uniforms(uniforms)
+                self._draw_fullscreen_triangle()
+        glViewport(0, 0, self._get_viewport_width(), self._get_viewport_height())
+
+        self._end_frame()
+
+    def _draw_tiles_from_block_ranges(self, uniforms: Dict[str, Any], tile_width: int,
+                                      tile_uniforms: List[Dict[str, Any]]):
+        """
+        Draw tiles whose overrides are all uniform block members.
+
+        Every tile's block is staged first and uploaded in one call; each
+        draw then binds its own range of the tile buffer, so the GPU never
+        waits on a block being rewritten between tiles.
+        """
+        self._write_uniforms(uniforms)
+        writers = self._block_writers
+        blocks = self._ensure_tile_blocks(len(tile_uniforms))
+        words = self.uniform_data.size
+
+        for i, overrides in enumerate(tile_uniforms):
+            for name, value in overrides.items():
+                writers[name](value)
+            writers['iTileOrigin']((float(i * tile_width), 0.0))
+            blocks[i, :words] = self.uniform_data
+
+        self._bind_buffer(GL_UNIFORM_BUFFER, self.tile_ubo)
+        glBufferSubData(GL_UNIFORM_BUFFER, 0, blocks.nbytes, blocks)
+
+        stride = self._tile_block_stride
+        for i in range(len(tile_uniforms)):
+            glBindBufferRange(GL_UNIFORM_BUFFER, UNIFORM_BLOCK_BINDING, self.tile_ubo,
+                              i * stride, self.uniform_data.nbytes)
+            glViewport(i * tile_width, 0, tile_width, self.height)
+            self._draw_fullscreen_triangle()
+
+        # Plain render() calls use the single frame block again. Indexed
+        # binds also set the generic binding, so keep the bind cache in step.
+        glBindBufferBase(GL_UNIFORM_BUFFER, UNIFORM_BLOCK_BINDING, self.ubo)
+        self._bound_buffers[GL_UNIFORM_BUFFER] = self.ubo
+
+    def _begin_frame(self) -> Dict[str, Any]:
+        """Advance the frame clock and collect this frame's uniforms."""
+        if self.pending_shader is not None:
+            self._poll_pending_shader()
+
         if not self.program:
             raise RuntimeError("No shader loaded. Call load_shader() first.")
-        
-        elapsed = time.time() - self.start_time
-        dt = elapsed - (self.frame_count / 60.0) if self.frame_count > 0 else 0.016
+
+        # One monotonic clock read per frame, shared with the FPS counter
+        self.frame_ns = time.perf_counter_ns()
+        elapsed = (self.frame_ns - self.start_ns) * 1e-9
+        dt = elapsed - self.last_frame_elapsed if self.frame_count > 0 else 0.016
+        self.last_frame_elapsed = elapsed
         self.uniform_manager.update(dt)
 
         # Collect all uniforms (from sources + built-ins)
-        uniforms = self.uniform_manager.get_all_uniforms()
+        uniforms = self._uniform_cache
+        self.uniform_manager.get_all_uniforms_into(uniforms)
         uniforms['iTime'] = elapsed
         uniforms['iFrame'] = self.frame_count
         uniforms['iResolution'] = (float(self.width), float(self.height), 1.0)
-
-        glUseProgram(self.program)
-
-        # Set all uniforms automatically based on type
-        for name, value in uniforms.items():
-            if name not in self.uniform_locs:
-                continue
-
-            loc = self.uniform_locs[name]
-
-            # Detect type and set appropriate uniform
-            if isinstance(value, (tuple, list)):
-                if len(value) == 2:
-                    glUniform2f(loc, *value)
-                elif len(value) == 3:
-                    glUniform3f(loc, *value)
-                elif len(value) == 4:
-                    glUniform4f(loc, *value)
-            elif isinstance(value, int):
-                glUniform1i(loc, value)
-            elif isinstance(value, float):
-                glUniform1f(loc, value)
-        
-        for i in range(4):
-            if i in self.textures and self.textures[i] is not None:
-                glActiveTexture(GL_TEXTURE0 + i)
-                glBindTexture(GL_TEXTURE_2D, self.textures[i])
-        
-        glClear(GL_COLOR_BUFFER_BIT)
-        
-        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
-        pos_attrib = glGetAttribLocation(self.program, b"position")
-        glEnableVertexAttribArray(pos_attrib)
-        glVertexAttribPointer(pos_attrib, 2, GL_FLOAT, GL_FALSE, 0, None)
-        
-        glDrawArrays(GL_TRIANGLE_STRIP, 0, 4)
-        
-        glDisableVertexAttribArray(pos_attrib)
+        uniforms['iTileOrigin'] = (0.0, 0.0)
+
+        # Stays bound from load_shader unless something else switched programs
+        self._use_program(self.program)
+        return uniforms
+
+    def _set_uniforms(self, uniforms: Dict[str, Any]):
+        """Upload uniform values to the current program."""
+        self._write_uniforms(uniforms)
+
+        # Upload the whole uniform block (or the legacy vec4 array) in a single call
+        data = self.uniform_data
+        if self.ubo is not None:
+            self._bind_buffer(GL_UNIFORM_BUFFER, self.ubo)
+            glBufferSubData(GL_UNIFORM_BUFFER, 0, data.nbytes, data)
+        elif self.uniform_array_loc >= 0:
+            glUniform4fv(self.uniform_array_loc, UNIFORM_ARRAY_VEC4S, data)
         
+    def _write_uniforms(self, uniforms: Dict[str, Any]):
+        """Pack block uniforms into the staging array; set the rest through per-program setters."""
+        writers = self.uniform_writers
+        for name, value in uniforms.items():
+            writer = writers.get(name)
+            if writer is not None:
+                writer(value)
+
+    def _clear(self):
+        """Clear the render target before drawing, if requested."""
+        if self.clear_before_draw:
+            glClear(GL_COLOR_BUFFER_BIT)
+
+    def _draw_fullscreen_triangle(self):
+        """Draw the fullscreen triangle with the current program."""
+        if self.vao is not None:
+            glBindVertexArray(self.vao)
+        glDrawArrays(GL_TRIANGLES, 0, 3)
+
+    def _end_frame(self):
+        """Present the frame and update frame counters."""
         self._swap_buffers()
         
         self.frame_count += 1
         
         self.fps_frames += 1
-        current_time = time.time()
-        if current_time - self.last_fps_time >= 1.0:
-            self.fps = self.fps_frames / (current_time - self.last_fps_time)
-            self.last_fps_time = current_time
+        interval_ns = self.frame_ns - self.last_fps_ns
+        if interval_ns >= 1_000_000_000:
+            self.fps = self.fps_frames * 1e9 / interval_ns
+            self.last_fps_ns = self.frame_ns
             self.fps_frames = 0
     
-    def read_pixels(self) -> np.ndarray:
-        """Read rendered pixels from OpenGL framebuffer."""
-        pixel_data = glReadPixels(0, 0, self.width, self.height, GL_RGB, GL_UNSIGNED_BYTE)
-        frame = np.frombuffer(pixel_data, dtype=np.uint8)
-        frame = frame.reshape((self.height, self.width, 3))
-        frame = np.flip(frame, axis=0).copy()
-        return frame
+    def read_pixels(self, copy: bool = True) -> np.ndarray:
+        """
+        Read rendered pixels from OpenGL framebuffer.
+
+        Args:
+            copy: Return an independent array. With False the result is a
+                view into the readback buffer, valid only until the next
+                read - for callers that consume each frame immediately.
+
+        Returns:
+            RGB array of shape (height, width, 3), top row first
+        """
+        frame = self.readback.read(self.width, self.height, self.async_readback)
+        # Flip rows top-first (OpenGL origin is bottom-left), drop any alpha
+        # and reorder BGR - all as a strided view, no copy
+        pixels = frame[::-1, :, self.rgb_channels]
+        return pixels.copy() if copy else pixels
     
     def get_stats(self) -> dict:
         """Get rendering statistics."""
-        elapsed = time.time() - self.start_time
+        elapsed = (time.perf_counter_ns() - self.start_ns) * 1e-9
         avg_fps = self.frame_count / elapsed if elapsed > 0 else 0
         
         return {
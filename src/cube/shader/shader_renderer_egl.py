@@ -7,6 +7,7 @@ layers by the display utility.
 """
 
 import os
+import threading
 
 # Configure PyOpenGL for EGL before importing
 os.environ['PYOPENGL_PLATFORM'] = 'egl'
@@ -14,10 +15,45 @@ os.environ['PYOPENGL_PLATFORM'] = 'egl'
 from OpenGL.GL import *
 from OpenGL import EGL
 from OpenGL.platform import PLATFORM
-from ctypes import pointer, c_int, c_void_p, CDLL, c_char_p
+from ctypes import pointer, byref, cast, c_int, c_uint, c_uint32, c_ubyte, c_void_p, CDLL, c_char_p, POINTER
+
+import numpy as np
 
 from .shader_renderer_base import ShaderRendererBase
 
+# gbm.h: DRM_FORMAT_ARGB8888 ('AR24', bytes B, G, R, A in memory) and usage flags
+GBM_FORMAT_ARGB8888 = 0x34325241
+GBM_BO_USE_RENDERING = 1 << 2
+GBM_BO_USE_LINEAR = 1 << 4
+GBM_BO_TRANSFER_READ = 1 << 0
+
+# EGL context each thread last made current through an EGLShaderRenderer
+_current = threading.local()
+
+
+def _attrib_list(*attribs):
+    """Build an EGL_NONE-terminated attribute array for EGL calls."""
+    values = (*attribs, EGL.EGL_NONE)
+    return (c_int * len(values))(*values)
+
+
+# Try very minimal config first - Raspberry Pi can be picky.
+# Rendering goes to a color-only FBO, so ask for no depth/stencil
+_CONFIG_ATTRIBS = _attrib_list(
+    EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_ES2_BIT,
+    EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+    EGL.EGL_DEPTH_SIZE, 0,
+    EGL.EGL_STENCIL_SIZE, 0,
+)
+
+# Fallback with absolutely no requirements except GLES2
+_ANY_CONFIG_ATTRIBS = _attrib_list(EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_ES2_BIT)
+
+# OpenGL ES 3.0 context
+_CONTEXT_ATTRIBS = _attrib_list(EGL.EGL_CONTEXT_CLIENT_VERSION, 3)
+
+_NO_ATTRIBS = _attrib_list()
+
 
 class EGLShaderRenderer(ShaderRendererBase):
     """
@@ -41,9 +77,23 @@ class EGLShaderRenderer(ShaderRendererBase):
         self.egl_context = None
         self.egl_surface = None
         self.drm_fd = None
+        self.gbm = None
         self.gbm_device = None
+        # Linear GBM buffer backing the FBO color texture, mapped by
+        # read_pixels() instead of reading back through GL (when available)
+        self.gbm_bo = None
+        self.gbm_frame = None
+        # Fence after the last draw into the GBM buffer, waited on before mapping it
+        self.gbm_fence = None
         self.fbo = None
         self.fbo_texture = None
+        self.invalidate_attachments = None
+        self.egl_image = None
+        # Bare eglMakeCurrent and its arguments, resolved once in _init_context
+        self._egl_make_current = None
+        self._egl_current_args = None
+        # Framebuffer bound in our context, to skip per-frame rebinds
+        self._bound_fbo = None
 
         super().__init__(width, height, scale=1)
         print(f"EGL shader renderer initialized: {width}×{height} (headless)")
@@ -60,6 +110,7 @@ class EGLShaderRenderer(ShaderRendererBase):
                 self.egl_surface,
                 self.egl_context
             )
+            _current.context = self.egl_context if result else None
             return bool(result)
         except Exception as e:
             print(f"Error making EGL context current: {e}")
@@ -87,6 +138,7 @@ class EGLShaderRenderer(ShaderRendererBase):
 
             if not self.gbm_device:
                 raise RuntimeError("Failed to create GBM device")
+            self.gbm = gbm
 
             # Get EGL display from GBM device using platform extension
             # EGL_PLATFORM_GBM_KHR = 0x31D7
@@ -133,19 +185,12 @@ class EGLShaderRenderer(ShaderRendererBase):
             error = EGL.eglGetError()
             raise RuntimeError(f"Failed to bind OpenGL ES API (error: 0x{error:x})")
 
-        # Try very minimal config first - Raspberry Pi can be picky
-        config_attribs = [
-            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_ES2_BIT,
-            EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
-            EGL.EGL_NONE
-        ]
-
         configs = (EGL.EGLConfig * 10)()
         num_configs = c_int()
 
         if not EGL.eglChooseConfig(
             self.egl_display,
-            (c_int * len(config_attribs))(*config_attribs),
+            _CONFIG_ATTRIBS,
             configs,
             10,
             pointer(num_configs)
@@ -156,14 +201,9 @@ class EGLShaderRenderer(ShaderRendererBase):
         if num_configs.value == 0:
             # Try with absolutely no requirements except GLES2
             print("Warning: No configs found with PBuffer, trying any config...")
-            config_attribs = [
-                EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_ES2_BIT,
-                EGL.EGL_NONE
-            ]
-
             if not EGL.eglChooseConfig(
                 self.egl_display,
-                (c_int * len(config_attribs))(*config_attribs),
+                _ANY_CONFIG_ATTRIBS,
                 configs,
                 10,
                 pointer(num_configs)
@@ -184,17 +224,11 @@ class EGLShaderRenderer(ShaderRendererBase):
 
         if not supports_surfaceless:
             # Need to create a PBuffer if surfaceless isn't supported
-            pbuffer_attribs = [
-                EGL.EGL_WIDTH, self.width,
-                EGL.EGL_HEIGHT, self.height,
-                EGL.EGL_NONE
-            ]
-
             try:
                 self.egl_surface = EGL.eglCreatePbufferSurface(
                     self.egl_display,
                     configs[0],
-                    (c_int * len(pbuffer_attribs))(*pbuffer_attribs)
+                    _attrib_list(EGL.EGL_WIDTH, self.width, EGL.EGL_HEIGHT, self.height)
                 )
 
                 if self.egl_surface == EGL.EGL_NO_SURFACE:
@@ -208,16 +242,11 @@ class EGLShaderRenderer(ShaderRendererBase):
             print("Using surfaceless context for offscreen rendering")
         
         # Create OpenGL ES 3.0 context
-        context_attribs = [
-            EGL.EGL_CONTEXT_CLIENT_VERSION, 3,
-            EGL.EGL_NONE
-        ]
-
         self.egl_context = EGL.eglCreateContext(
             self.egl_display,
             configs[0],
             EGL.EGL_NO_CONTEXT,
-            (c_int * len(context_attribs))(*context_attribs)
+            _CONTEXT_ATTRIBS
         )
 
         if self.egl_context == EGL.EGL_NO_CONTEXT:
@@ -232,6 +261,18 @@ class EGLShaderRenderer(ShaderRendererBase):
         ):
             error = EGL.eglGetError()
             raise RuntimeError(f"Failed to make EGL context current (error: 0x{error:x})")
+        _current.context = self.egl_context
+
+        # Per-frame eglMakeCurrent calls go straight to libEGL, skipping
+        # PyOpenGL's wrapper; handles are converted to pointers once here
+        make_current = PLATFORM.EGL['eglMakeCurrent']
+        make_current.argtypes = [c_void_p, c_void_p, c_void_p, c_void_p]
+        make_current.restype = c_uint
+        self._egl_make_current = make_current
+        self._egl_current_args = tuple(
+            cast(handle, c_void_p)
+            for handle in (self.egl_display, self.egl_surface, self.egl_surface, self.egl_context)
+        )
 
         print("Created offscreen OpenGL context via EGL (headless)")
 
@@ -263,27 +304,170 @@ class EGLShaderRenderer(ShaderRendererBase):
         # Generate and bind FBO
         fbo = glGenFramebuffers(1)
         glBindFramebuffer(GL_FRAMEBUFFER, fbo)
-
-        # Create texture for color attachment (use RGBA for better OpenGL ES compatibility)
-        texture = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, self.width, self.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-
-        # Attach texture to FBO
-        glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, texture, 0)
-
-        # Check FBO status
-        status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
-        if status != GL_FRAMEBUFFER_COMPLETE:
+        self._bound_fbo = fbo
+
+        # Color buffer candidates: a CPU-mappable GBM buffer, then immutable
+        # RGB8 (the LEDs only need RGB), then RGBA8 for OpenGL ES compatibility
+        status = None
+        for storage in ('gbm', GL_RGB8, GL_RGBA8):
+            texture = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, texture)
+            # Only ever read back whole, never sampled with filtering
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+
+            if storage == 'gbm':
+                if not self._create_gbm_color_buffer():
+                    glDeleteTextures([texture])
+                    continue
+            else:
+                # Single level, immutable: no mip chain to allocate or validate
+                glTexStorage2D(GL_TEXTURE_2D, 1, storage, self.width, self.height)
+
+            # Attach texture to FBO
+            glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, texture, 0)
+
+            # Check FBO status
+            status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+            if status == GL_FRAMEBUFFER_COMPLETE:
+                break
+
+            # Deleting the texture also detaches it
+            glDeleteTextures([texture])
+            if storage == 'gbm':
+                self._release_gbm_color_buffer()
+        else:
             raise RuntimeError(f"Framebuffer is not complete: 0x{status:x}")
 
         self.fbo = fbo
         self.fbo_texture = texture
 
+        # GLES 3.0 can discard old attachment contents so tiled GPUs (the
+        # Pi's VideoCore) never load them back into tile memory
+        self.invalidate_attachments = None
+        if bool(glInvalidateFramebuffer):
+            self.invalidate_attachments = (GLenum * 1)(GL_COLOR_ATTACHMENT0)
+
         print(f"Created FBO {fbo} with texture {texture} ({self.width}x{self.height})")
 
+    def _create_gbm_color_buffer(self) -> bool:
+        """
+        Back the bound texture with a linear GBM buffer object.
+
+        The Pi's GPU renders into the same DRAM the CPU reads, so mapping the
+        buffer replaces the glReadPixels copy in read_pixels().
+
+        Returns:
+            True if the texture now uses the GBM buffer as its storage
+        """
+        if self.gbm is None:
+            return False
+
+        egl_extensions = EGL.eglQueryString(self.egl_display, EGL.EGL_EXTENSIONS) or b''
+        gl_extensions = glGetString(GL_EXTENSIONS) or b''
+        if b'EGL_KHR_image_pixmap' not in egl_extensions or b'GL_OES_EGL_image' not in gl_extensions:
+            return False
+
+        gbm = self.gbm
+        gbm.gbm_bo_create.argtypes = [c_void_p, c_uint32, c_uint32, c_uint32, c_uint32]
+        gbm.gbm_bo_create.restype = c_void_p
+        gbm.gbm_bo_map.argtypes = [c_void_p, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+                                   POINTER(c_uint32), POINTER(c_void_p)]
+        gbm.gbm_bo_map.restype = c_void_p
+        gbm.gbm_bo_unmap.argtypes = [c_void_p, c_void_p]
+        gbm.gbm_bo_destroy.argtypes = [c_void_p]
+
+        bo = gbm.gbm_bo_create(c_void_p(self.gbm_device), self.width, self.height,
+                               GBM_FORMAT_ARGB8888, GBM_BO_USE_RENDERING | GBM_BO_USE_LINEAR)
+        if not bo:
+            print("Warning: Failed to create GBM buffer, reading back through GL")
+            return False
+
+        try:
+            from OpenGL.raw.EGL.KHR.image_base import eglCreateImageKHR
+            from OpenGL.raw.EGL.KHR.image_pixmap import EGL_NATIVE_PIXMAP_KHR
+            from OpenGL.raw.GLES2.OES.EGL_image import glEGLImageTargetTexture2DOES
+
+            image = eglCreateImageKHR(
+                self.egl_display,
+                EGL.EGL_NO_CONTEXT,
+                EGL_NATIVE_PIXMAP_KHR,
+                c_void_p(bo),
+                _NO_ATTRIBS
+            )
+            if not image:
+                error = EGL.eglGetError()
+                raise RuntimeError(f"eglCreateImageKHR failed (error: 0x{error:x})")
+            glEGLImageTargetTexture2DOES(GL_TEXTURE_2D, image)
+        except Exception as e:
+            print(f"Warning: Could not render into GBM buffer ({e}), reading back through GL")
+            gbm.gbm_bo_destroy(c_void_p(bo))
+            return False
+
+        self.gbm_bo = bo
+        # The FBO texture's storage; destroyed with the GBM buffer
+        self.egl_image = image
+        print(f"Rendering into linear GBM buffer ({self.width}x{self.height})")
+        return True
+
+    def _release_gbm_color_buffer(self):
+        """Destroy the GBM buffer and its EGLImage (after the texture using them)."""
+        if self.egl_image is not None:
+            from OpenGL.raw.EGL.KHR.image_base import eglDestroyImageKHR
+            eglDestroyImageKHR(self.egl_display, self.egl_image)
+            self.egl_image = None
+        if self.gbm_bo is not None:
+            self.gbm.gbm_bo_destroy(c_void_p(self.gbm_bo))
+            self.gbm_bo = None
+
+    def _read_gbm_bo(self, copy: bool) -> np.ndarray:
+        """Read the frame by mapping the GBM buffer the FBO renders into."""
+        if self.gbm_fence is not None:
+            glClientWaitSync(self.gbm_fence, GL_SYNC_FLUSH_COMMANDS_BIT, GL_TIMEOUT_IGNORED)
+            glDeleteSync(self.gbm_fence)
+            self.gbm_fence = None
+        else:
+            glFinish()
+
+        width, height = self.width, self.height
+        stride = c_uint32()
+        map_data = c_void_p()
+        ptr = self.gbm.gbm_bo_map(c_void_p(self.gbm_bo), 0, 0, width, height,
+                                  GBM_BO_TRANSFER_READ, byref(stride), byref(map_data))
+        if not ptr:
+            raise RuntimeError("Failed to map GBM buffer for reading")
+
+        if self.gbm_frame is None or self.gbm_frame.shape[:2] != (height, width):
+            self.gbm_frame = np.empty((height, width, 4), dtype=np.uint8)
+        try:
+            # Rows may be padded; copy out before the mapping goes away
+            rows = np.ctypeslib.as_array((c_ubyte * (stride.value * height)).from_address(ptr))
+            rows = rows.reshape(height, stride.value)[:, :width * 4]
+            self.gbm_frame[:] = rows.reshape(height, width, 4)
+        finally:
+            self.gbm.gbm_bo_unmap(c_void_p(self.gbm_bo), map_data)
+
+        # Rows are in framebuffer order like glReadPixels (bottom row first);
+        # flip them top-first and BGRA -> RGB as a view
+        pixels = self.gbm_frame[::-1, :, 2::-1]
+        return pixels.copy() if copy else pixels
+
+    def _get_readback_format(self):
+        """
+        Read RGB or BGRA when it is the driver's preferred readback format
+        for the FBO, otherwise RGBA (the format OpenGL ES always supports).
+        """
+        try:
+            preferred = (glGetIntegerv(GL_IMPLEMENTATION_COLOR_READ_FORMAT),
+                         glGetIntegerv(GL_IMPLEMENTATION_COLOR_READ_TYPE))
+        except Exception:
+            preferred = None
+        if preferred == (GL_RGB, GL_UNSIGNED_BYTE):
+            return GL_RGB, 3
+        if preferred == (GL_BGRA, GL_UNSIGNED_BYTE):
+            return GL_BGRA, 4
+        return GL_RGBA, 4
+
     def _get_viewport_width(self) -> int:
         """Get viewport width."""
         return self.width
@@ -292,55 +476,75 @@ class EGLShaderRenderer(ShaderRendererBase):
         """Get viewport height."""
         return self.height
     
+    def _clear(self):
+        """Discard the previous frame so tiled GPUs never load it back."""
+        if self.invalidate_attachments is not None:
+            glInvalidateFramebuffer(GL_FRAMEBUFFER, 1, self.invalidate_attachments)
+        super()._clear()
+
     def _swap_buffers(self):
         """Swap buffers (no-op for offscreen rendering)."""
-        # Ensure framebuffer rendering is complete
+        if self.gbm_bo is not None:
+            # Let _read_gbm_bo wait for just this frame rather than glFinish
+            if self.gbm_fence is not None:
+                glDeleteSync(self.gbm_fence)
+            self.gbm_fence = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+        # Submit the frame so the GPU starts on it while the CPU moves on
         glFlush()
 
+    def _ensure_current(self, operation: str):
+        """
+        Make this renderer's context current for a per-frame operation.
+
+        Skipped when this thread's last eglMakeCurrent through a renderer was
+        for our context. Renderers on one thread (e.g. mixer channels) still
+        switch, since each records its own context.
+        """
+        if getattr(_current, 'context', None) is self.egl_context:
+            return
+        if not self._egl_make_current(*self._egl_current_args):
+            error = EGL.eglGetError()
+            raise RuntimeError(f"Failed to make context current for {operation} (error: 0x{error:x})")
+        _current.context = self.egl_context
+
+    def _bind_fbo(self):
+        """Bind our FBO unless it is already bound in our context."""
+        if self._bound_fbo != self.fbo:
+            glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+            self._bound_fbo = self.fbo
+
     def render(self):
         """Render a frame, ensuring EGL context is current."""
         # Make sure EGL context is current before rendering
-        if not EGL.eglMakeCurrent(
-            self.egl_display,
-            self.egl_surface,
-            self.egl_surface,
-            self.egl_context
-        ):
-            error = EGL.eglGetError()
-            raise RuntimeError(f"Failed to make context current for render (error: 0x{error:x})")
+        self._ensure_current("render")
 
         # Ensure FBO is bound for rendering
-        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        self._bind_fbo()
 
         # Call parent render method
         super().render()
 
-    def read_pixels(self):
-        """Read pixels from FBO, ensuring proper binding."""
-        import numpy as np
+    def render_tiles(self, tile_width, tile_uniforms):
+        """Render tiles side by side, ensuring EGL context is current."""
+        self._ensure_current("render")
 
+        # Ensure FBO is bound for rendering
+        self._bind_fbo()
+
+        super().render_tiles(tile_width, tile_uniforms)
+
+    def read_pixels(self, copy=True):
+        """Read pixels from FBO, ensuring proper binding."""
         # Make sure context is current
-        if not EGL.eglMakeCurrent(
-            self.egl_display,
-            self.egl_surface,
-            self.egl_surface,
-            self.egl_context
-        ):
-            error = EGL.eglGetError()
-            raise RuntimeError(f"Failed to make context current for read_pixels (error: 0x{error:x})")
+        self._ensure_current("read_pixels")
 
         # Ensure FBO is bound for reading
-        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        self._bind_fbo()
 
-        # Read RGBA data (OpenGL ES requirement)
-        pixel_data = glReadPixels(0, 0, self.width, self.height, GL_RGBA, GL_UNSIGNED_BYTE)
+        if self.gbm_bo is not None:
+            return self._read_gbm_bo(copy)
 
-        # Convert to numpy array and flip vertically (OpenGL origin is bottom-left)
-        pixels = np.frombuffer(pixel_data, dtype=np.uint8).reshape(self.height, self.width, 4)
-        pixels = np.flipud(pixels)
-
-        # Convert RGBA to RGB (drop alpha channel)
-        return pixels[:, :, :3].copy()
+        return super().read_pixels(copy)
     
     def cleanup(self):
         """Clean up EGL resources."""
@@ -355,6 +559,7 @@ class EGLShaderRenderer(ShaderRendererBase):
                     self.egl_surface,
                     self.egl_context
                 )
+                _current.context = self.egl_context
             except:
                 pass
 
@@ -364,11 +569,37 @@ class EGLShaderRenderer(ShaderRendererBase):
         except:
             pass
 
-        # Clean up shader program
-        if self.program is not None:
+        if self.gbm_fence is not None:
+            try:
+                glDeleteSync(self.gbm_fence)
+                self.gbm_fence = None
+            except:
+                pass
+
+        # Release the GBM buffer's EGLImage before the texture using it
+        if self.egl_image is not None:
             try:
-                glDeleteProgram(self.program)
-                self.program = None
+                from OpenGL.raw.EGL.KHR.image_base import eglDestroyImageKHR
+                eglDestroyImageKHR(self.egl_display, self.egl_image)
+                self.egl_image = None
+            except:
+                pass
+
+        # Clean up shader programs (the current one is among the loaded ones)
+        try:
+            self._delete_programs()
+        except:
+            pass
+        try:
+            self.program_cache.release()
+        except:
+            pass
+
+        # Clean up VAO
+        if self.vao is not None:
+            try:
+                glDeleteVertexArrays(1, [self.vao])
+                self.vao = None
             except:
                 pass
 
@@ -380,19 +611,40 @@ class EGLShaderRenderer(ShaderRendererBase):
             except:
                 pass
 
+        # Clean up uniform buffer
+        if self.ubo is not None:
+            try:
+                glDeleteBuffers(1, [self.ubo])
+                self.ubo = None
+            except:
+                pass
+
+        if self.tile_ubo is not None:
+            try:
+                glDeleteBuffers(1, [self.tile_ubo])
+                self.tile_ubo = None
+            except:
+                pass
+
+        # Clean up readback buffers (unmapped implicitly on delete)
+        if self.readback is not None:
+            try:
+                self.readback.release()
+                self.readback = None
+            except:
+                pass
+
         # Clean up textures
-        for tex_id in self.textures.values():
-            if tex_id is not None:
-                try:
-                    glDeleteTextures([tex_id])
-                except:
-                    pass
-        self.textures.clear()
+        try:
+            self._purge_texture_cache()
+        except:
+            pass
 
         # Clean up FBO and texture
         if self.fbo is not None:
             try:
                 glBindFramebuffer(GL_FRAMEBUFFER, 0)
+                self._bound_fbo = 0
                 glDeleteFramebuffers(1, [self.fbo])
                 self.fbo = None
             except:
@@ -416,6 +668,7 @@ class EGLShaderRenderer(ShaderRendererBase):
                     )
                 except:
                     pass
+                _current.context = None
 
                 if self.egl_context is not None:
                     EGL.eglDestroyContext(self.egl_display, self.egl_context)
@@ -431,6 +684,13 @@ class EGLShaderRenderer(ShaderRendererBase):
                 print(f"Warning: Error cleaning up EGL: {e}")
 
         # Clean up GBM and DRM resources
+        if self.gbm_bo is not None:
+            try:
+                self.gbm.gbm_bo_destroy(c_void_p(self.gbm_bo))
+                self.gbm_bo = None
+            except Exception as e:
+                print(f"Warning: Error destroying GBM buffer: {e}")
+
         if self.gbm_device is not None:
             try:
                 gbm = CDLL('libgbm.so.1')
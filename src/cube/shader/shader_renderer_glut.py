@@ -6,6 +6,11 @@ is already in use. This avoids conflicts from creating multiple pygame displays.
 """
 
 from OpenGL.GL import *
+from OpenGL.GLUT import (
+    glutInit, glutInitDisplayMode, glutInitWindowSize,
+    glutCreateWindow, glutHideWindow, glutDisplayFunc, glutSetWindow,
+    GLUT_RGBA, GLUT_DOUBLE, GLUT_DEPTH
+)
 
 from .shader_renderer_base import ShaderRendererBase
 
@@ -38,21 +43,25 @@ class GLUTShaderRenderer(ShaderRendererBase):
             return False
 
         try:
-            from OpenGL.GLUT import glutSetWindow
             glutSetWindow(self.glut_window)
             return True
         except Exception as e:
             print(f"Error making GLUT context current: {e}")
             return False
 
+    def _ensure_current(self, operation: str):
+        """
+        Make this renderer's window current before touching its GL objects.
+
+        Each mixer channel has its own GLUT window, and GL object names are
+        per context, so working in another channel's window would hit that
+        channel's objects.
+        """
+        if not self.make_context_current():
+            raise RuntimeError(f"Failed to make GLUT context current for {operation}")
+
     def _init_context(self):
         """Initialize GLUT offscreen context with OpenGL 3.3 Core Profile."""
-        from OpenGL.GLUT import (
-            glutInit, glutInitDisplayMode, glutInitWindowSize,
-            glutCreateWindow, glutHideWindow, glutDisplayFunc,
-            GLUT_RGBA, GLUT_DOUBLE, GLUT_DEPTH
-        )
-
         try:
             glutInit()
         except Exception as e:
@@ -86,7 +95,6 @@ class GLUTShaderRenderer(ShaderRendererBase):
         glutHideWindow()
 
         # Query actual OpenGL version we got
-        from OpenGL.GL import glGetString, GL_VERSION, GL_SHADING_LANGUAGE_VERSION
         gl_version = glGetString(GL_VERSION)
         glsl_version = glGetString(GL_SHADING_LANGUAGE_VERSION)
         print(f"Created offscreen OpenGL context via GLUT")
@@ -121,10 +129,20 @@ class GLUTShaderRenderer(ShaderRendererBase):
         """Clean up GLUT resources."""
         self.uniform_manager.cleanup()
 
-        for tex_id in self.textures.values():
-            if tex_id is not None:
-                glDeleteTextures([tex_id])
-        self.textures.clear()
+        # Callers (e.g. MixerChannel) may have another channel's window current
+        try:
+            self._ensure_current("cleanup")
+        except RuntimeError as e:
+            print(f"Warning: {e}, leaving GL objects alone")
+            return
+
+        if self.readback is not None:
+            self.readback.release()
+            self.readback = None
+
+        self._purge_texture_cache()
+        self._delete_programs()
+        self.program_cache.release()
 
         print("GLUT context cleaned up")
 
@@ -25,6 +25,8 @@ class UniformSource(ABC):
     Each source is independent and can be combined with others.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def update(self, dt: float):
         """
@@ -56,6 +58,15 @@ class UniformSource(ABC):
         pass
 
 
+# Keyboard key -> index into KeyboardUniformSource.key_state, laid out as
+# (negative, positive) pairs for the x, y and z axes of iInput
+_KEY_INDEX = {
+    'left': 0, 'right': 1,
+    'down': 2, 'up': 3,
+    'backward': 4, 'forward': 5,
+}
+
+
 class KeyboardUniformSource(UniformSource):
     """
     Keyboard input source.
@@ -67,16 +78,18 @@ class KeyboardUniformSource(UniformSource):
     - iInput (vec4): (left/right, up/down, forward/backward, unused)
     """
 
+    __slots__ = ('_input_arr', '_uniforms', 'key_state')
+
     def __init__(self):
         """Initialize keyboard input source."""
-        self.input_state = {
-            'left': 0.0,
-            'right': 0.0,
-            'up': 0.0,
-            'down': 0.0,
-            'forward': 0.0,
-            'backward': 0.0,
-        }
+        # Key states in _KEY_INDEX order: each (negative, positive) pair
+        # differenced gives one iInput axis
+        self.key_state = np.zeros(len(_KEY_INDEX), dtype=np.float32)
+
+        # iInput is kept up to date in place as keys change, so reading it
+        # every frame costs nothing and uploads straight from the array
+        self._input_arr = np.zeros(4, dtype=np.float32)
+        self._uniforms = {'iInput': self._input_arr}
 
     def set_key_state(self, key: str, pressed: bool):
         """
@@ -86,8 +99,11 @@ class KeyboardUniformSource(UniformSource):
             key: Key name ('left', 'right', 'up', 'down', 'forward', 'backward')
             pressed: True if key is pressed, False if released
         """
-        if key in self.input_state:
-            self.input_state[key] = 1.0 if pressed else 0.0
+        index = _KEY_INDEX.get(key)
+        if index is not None:
+            state = self.key_state
+            state[index] = 1.0 if pressed else 0.0
+            np.subtract(state[1::2], state[0::2], out=self._input_arr[:3])
 
     def update(self, dt: float):
         """Update keyboard input (no-op, state updated via set_key_state)."""
@@ -98,15 +114,9 @@ class KeyboardUniformSource(UniformSource):
         Get keyboard input as iInput uniform.
 
         Returns:
-            {'iInput': (lr, ud, fb, 0.0)}
+            {'iInput': array([lr, ud, fb, 0.0])} - shared, updated in place
         """
-        lr = self.input_state['right'] - self.input_state['left']
-        ud = self.input_state['up'] - self.input_state['down']
-        fb = self.input_state['forward'] - self.input_state['backward']
-
-        return {
-            'iInput': (lr, ud, fb, 0.0)
-        }
+        return self._uniforms
 
     def cleanup(self):
         """No cleanup needed for keyboard input."""
@@ -114,8 +124,13 @@ class KeyboardUniformSource(UniformSource):
 
     def reset(self):
         """Reset all keys to unpressed state."""
-        for key in self.input_state:
-            self.input_state[key] = 0.0
+        self.key_state[:] = 0.0
+        self._input_arr[:] = 0.0
+
+
+# Frames between BPM refreshes from the audio processor (tempo estimates
+# change far slower than the frame rate)
+_BPM_REFRESH_FRAMES = 30
 
 
 class AudioFileUniformSource(UniformSource):
@@ -131,6 +146,12 @@ class AudioFileUniformSource(UniformSource):
     - iBeatPulse (float): Pulse on beat (1.0 at beat, decays to 0.0)
     """
 
+    __slots__ = (
+        '_beats_per_second', '_bpm', '_bpm_refresh_countdown', '_uniforms',
+        'audio_path', 'beat_phase', 'beat_pulse', 'has_audio', 'last_beat_time',
+        'manual_bpm', 'processor', 'start_time',
+    )
+
     def __init__(self, audio_path: str, bpm: Optional[float] = None):
         """
         Initialize audio file input.
@@ -152,12 +173,13 @@ class AudioFileUniformSource(UniformSource):
             self.processor = None
             self.has_audio = False
 
-        # Audio state
-        self.start_time = time.time()
+        # Audio state (monotonic, so clock adjustments don't jump the beat)
+        self.start_time = time.monotonic()
         self.bpm = bpm if bpm else 120.0  # Default BPM
         self.beat_phase = 0.0
         self.beat_pulse = 0.0
         self.last_beat_time = 0.0
+        self._bpm_refresh_countdown = _BPM_REFRESH_FRAMES
 
         # If we have a processor, get actual BPM
         if self.has_audio and self.processor:
@@ -167,6 +189,19 @@ class AudioFileUniformSource(UniformSource):
             elif self.manual_bpm:
                 self.bpm = self.manual_bpm
 
+        self._uniforms = {}
+
+    @property
+    def bpm(self) -> float:
+        """Current tempo in beats per minute."""
+        return self._bpm
+
+    @bpm.setter
+    def bpm(self, value: float):
+        self._bpm = value
+        # Derived once per tempo change rather than every frame
+        self._beats_per_second = value / 60.0
+
     def update(self, dt: float):
         """
         Update audio state.
@@ -174,20 +209,22 @@ class AudioFileUniformSource(UniformSource):
         Args:
             dt: Delta time since last update
         """
-        elapsed = time.time() - self.start_time
-
         if self.has_audio and self.processor:
             # Use audio processor for accurate beat detection
+            elapsed = time.monotonic() - self.start_time
             self.beat_phase = self.processor.get_beat_phase(elapsed)
             self.beat_pulse = self.processor.get_beat_pulse(elapsed)
-            self.bpm = self.processor.get_bpm()
+            self._bpm_refresh_countdown -= 1
+            if self._bpm_refresh_countdown <= 0:
+                self._bpm_refresh_countdown = _BPM_REFRESH_FRAMES
+                self.bpm = self.processor.get_bpm()
         else:
-            # Fallback: simple BPM-based beat tracking
-            beat_duration = 60.0 / self.bpm
-            self.beat_phase = (elapsed % beat_duration) / beat_duration
+            # Fallback: simple BPM-based beat tracking, advancing the phase by dt
+            beats_per_second = self._beats_per_second
+            self.beat_phase = (self.beat_phase + dt * beats_per_second) % 1.0
 
             # Simple beat pulse (1.0 at beat, decays over 0.1 seconds)
-            time_since_beat = elapsed - (int(elapsed / beat_duration) * beat_duration)
+            time_since_beat = self.beat_phase / beats_per_second
             self.beat_pulse = max(0.0, 1.0 - (time_since_beat / 0.1))
 
     def get_uniforms(self) -> Dict[str, Any]:
@@ -195,13 +232,14 @@ class AudioFileUniformSource(UniformSource):
         Get audio uniforms.
 
         Returns:
-            {'iBPM': float, 'iBeatPhase': float, 'iBeatPulse': float}
+            {'iBPM': float, 'iBeatPhase': float, 'iBeatPulse': float} - shared,
+            updated in place
         """
-        return {
-            'iBPM': self.bpm,
-            'iBeatPhase': self.beat_phase,
-            'iBeatPulse': self.beat_pulse,
-        }
+        uniforms = self._uniforms
+        uniforms['iBPM'] = self.bpm
+        uniforms['iBeatPhase'] = self.beat_phase
+        uniforms['iBeatPulse'] = self.beat_pulse
+        return uniforms
 
     def cleanup(self):
         """Clean up audio processor."""
@@ -211,7 +249,7 @@ class AudioFileUniformSource(UniformSource):
 
     def reset(self):
         """Reset audio playback to beginning."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.beat_phase = 0.0
         self.beat_pulse = 0.0
 
@@ -230,6 +268,11 @@ class MicrophoneUniformSource(UniformSource):
     - iAudioSpectrum (vec4): Frequency bands (bass, low-mid, high-mid, treble)
     """
 
+    __slots__ = (
+        '_uniforms', 'audio_level', 'beat_phase', 'beat_pulse', 'bpm',
+        'device_index', 'has_audio', 'pyaudio', 'spectrum',
+    )
+
     def __init__(self, device_index: Optional[int] = None):
         """
         Initialize microphone input.
@@ -255,6 +298,7 @@ class MicrophoneUniformSource(UniformSource):
         self.beat_pulse = 0.0
         self.audio_level = 0.0
         self.spectrum = (0.0, 0.0, 0.0, 0.0)
+        self._uniforms = {}
 
         # TODO: Initialize pyaudio stream for real-time capture
         # This would require:
@@ -281,15 +325,15 @@ class MicrophoneUniformSource(UniformSource):
         Get microphone uniforms.
 
         Returns:
-            Dictionary with audio-related uniforms
+            Dictionary with audio-related uniforms (shared, updated in place)
         """
-        return {
-            'iBPM': self.bpm,
-            'iBeatPhase': self.beat_phase,
-            'iBeatPulse': self.beat_pulse,
-            'iAudioLevel': self.audio_level,
-            'iAudioSpectrum': self.spectrum,
-        }
+        uniforms = self._uniforms
+        uniforms['iBPM'] = self.bpm
+        uniforms['iBeatPhase'] = self.beat_phase
+        uniforms['iBeatPulse'] = self.beat_pulse
+        uniforms['iAudioLevel'] = self.audio_level
+        uniforms['iAudioSpectrum'] = self.spectrum
+        return uniforms
 
     def cleanup(self):
         """Clean up audio stream."""
@@ -313,6 +357,8 @@ class CameraUniformSource(UniformSource):
     - iCameraResolution (vec2): Camera resolution
     """
 
+    __slots__ = ('device_index',)
+
     def __init__(self, device_index: int = 0):
         """
         Initialize camera input.
@@ -388,9 +434,22 @@ class UniformSourceManager:
             Combined dictionary of all uniforms
         """
         uniforms = {}
+        self.get_all_uniforms_into(uniforms)
+        return uniforms
+
+    def get_all_uniforms_into(self, uniforms: Dict[str, Any]):
+        """
+        Collect combined uniforms from all sources into an existing dict.
+
+        The dict is cleared first, so callers can reuse one dict every frame
+        instead of allocating a new one.
+
+        Args:
+            uniforms: Dictionary to fill
+        """
+        uniforms.clear()
         for source in self.sources:
             uniforms.update(source.get_uniforms())
-        return uniforms
 
     def cleanup(self):
         """Clean up all input sources."""
@@ -105,8 +105,35 @@ class VolumetricCubeRenderer:
             pos = tuple(c * face_distance for c in config['position'])
             self.faces[name] = CubeFace(name, pos, config['look_at'])
 
-        # Create a single shader renderer (will be reused with different cameras)
-        self.renderer = ShaderRenderer(face_size, face_size)
+        # One renderer with a face-sized tile per active face, side by side:
+        # every face is drawn in a single frame and read back at once. The
+        # shader wrapper makes fragCoord and gl_FragCoord tile-local, so
+        # shaders render each tile as if it were the whole frame.
+        self.renderer = ShaderRenderer(face_size * self.num_panels, face_size)
+        # render_all_faces() is one render and one read per frame, so collect
+        # each frame while the next is drawn (one frame of latency)
+        self.renderer.async_readback = True
+
+        # Face cameras are static, so their uniform overrides are built once
+        self.face_uniforms = {}
+        for name, face in self.faces.items():
+            pos, right, up, forward = face.camera.get_vectors()
+            self.face_uniforms[name] = {
+                'iCameraPos': pos,
+                'iCameraRight': right,
+                'iCameraUp': up,
+                'iCameraForward': forward,
+            }
+        # Tile overrides in face order, as render_all_faces() passes them
+        self.tile_uniforms = [self.face_uniforms[name] for name in self.active_faces]
+
+        # Per-face output buffers, refilled every frame instead of reallocated.
+        # They are views into one contiguous block so a frame is split into
+        # faces with a single copy.
+        self.face_block = np.empty((self.num_panels, face_size, face_size, 3), dtype=np.uint8)
+        self.face_pixels = {
+            name: self.face_block[i] for i, name in enumerate(self.active_faces)
+        }
 
         print(f"Volumetric cube renderer initialized: {face_size}×{face_size} per face")
         print(f"Number of panels: {self.num_panels}")
@@ -131,21 +158,24 @@ class VolumetricCubeRenderer:
             face_name: Name of face to render (front, back, left, right, top, bottom)
 
         Returns:
-            Pixel array of shape (face_size, face_size, 3)
+            Pixel array of shape (face_size, face_size, 3), reused by the
+            next render of the same face
         """
         if face_name not in self.faces:
             raise ValueError(f"Unknown face: {face_name}")
 
-        face = self.faces[face_name]
-
-        # Set camera for this face
-        self.renderer.set_camera_mode(face.camera)
-
-        # Render
-        self.renderer.render()
+        # Draw just this face into the first tile. The previous asynchronous
+        # frame may hold other faces, so this read waits for its own frame.
+        self.renderer.render_tiles(self.face_size, [self.face_uniforms[face_name]])
+        self.renderer.async_readback = False
+        try:
+            pixels = self.renderer.read_pixels(copy=False)
+        finally:
+            self.renderer.async_readback = True
 
-        # Read pixels
-        return self.renderer.read_pixels()
+        out = self.face_pixels[face_name]
+        np.copyto(out, pixels[:, :self.face_size])
+        return out
 
     def render_all_faces(self) -> Dict[str, np.ndarray]:
         """
@@ -154,10 +184,14 @@ class VolumetricCubeRenderer:
         Returns:
             Dictionary mapping face name -> pixel array (only for active faces)
         """
-        return {
-            name: self.render_face(name)
-            for name in self.faces.keys()
-        }
+        self.renderer.render_tiles(self.face_size, self.tile_uniforms)
+        # One readback for every face; tiles are column slices of it, so
+        # viewing the columns as (panel, row, column) maps it onto face_block
+        pixels = self.renderer.read_pixels(copy=False)
+        size = self.face_size
+        tiles = pixels.reshape(size, self.num_panels, size, 3).swapaxes(0, 1)
+        np.copyto(self.face_block, tiles)
+        return self.face_pixels
 
     def get_face_order(self) -> list:
         """Get active face ordering for consistent layout."""
@@ -238,46 +272,57 @@ class CubePreviewRenderer:
         pygame.display.set_caption(f"Volumetric Cube Preview - {self.num_panels} Face{'s' if self.num_panels > 1 else ''}")
         self.clock = pygame.time.Clock()
 
+        # Per-face surfaces and labels, reused every frame. render_all_faces()
+        # refills the same row-major RGB arrays, so each face surface wraps
+        # its array directly and no per-frame copy or axis swap is needed.
+        # Faces are gathered into an unscaled atlas of the grid, which is
+        # scaled straight into the window in one go; cells without a face
+        # stay black, so the window never needs clearing.
+        face_px = (self.face_size, self.face_size)
+        scaled_px = (self.face_size * scale, self.face_size * scale)
+        self.face_surfaces = {}
+        self.atlas_blits = []
+        self.label_blits = []
+        font = pygame.font.Font(None, 24)
+        for name, (grid_x, grid_y) in self.layout.items():
+            self.face_surfaces[name] = pygame.image.frombuffer(
+                cube_renderer.face_pixels[name], face_px, 'RGB')
+            self.atlas_blits.append(
+                (self.face_surfaces[name], (grid_x * face_px[0], grid_y * face_px[1])))
+
+            # Window position of the face's grid cell
+            x = grid_x * scaled_px[0]
+            y = grid_y * scaled_px[1]
+            text = font.render(name.upper(), True, (255, 255, 255))
+            self.label_blits.append((text, text.get_rect(center=(x + scaled_px[0] // 2, y + 10))))
+
+        # transform.scale() into a target needs the source's pixel format, so
+        # the atlas takes the window's format (faces convert as they are
+        # gathered) and scales directly into the window surface
+        self.atlas = pygame.Surface(
+            (grid_width * self.face_size, grid_height * self.face_size), 0, self.screen)
+        self.atlas.fill((0, 0, 0))
+
         print(f"Preview window: {self.window_width}×{self.window_height} ({self.num_panels} faces)")
 
     def render_frame(self):
         """Render one frame of the preview."""
         import pygame
 
-        # Render all faces
-        faces = self.cube.render_all_faces()
-
-        # Clear screen
-        self.screen.fill((0, 0, 0))
-
-        # Draw each face in its position
-        for name, pixels in faces.items():
-            grid_x, grid_y = self.layout[name]
+        # Render all faces (into the arrays the face surfaces wrap)
+        self.cube.render_all_faces()
 
-            # Convert numpy array to pygame surface
-            # Flip vertically because pygame uses top-left origin
-            surface = pygame.surfarray.make_surface(np.swapaxes(pixels, 0, 1))
+        # Gather faces into the atlas at their grid cells
+        self.atlas.blits(self.atlas_blits, doreturn=False)
 
-            # Scale up
-            if self.scale > 1:
-                surface = pygame.transform.scale(
-                    surface,
-                    (self.face_size * self.scale, self.face_size * self.scale)
-                )
-
-            # Blit to screen
-            x = grid_x * self.face_size * self.scale
-            y = grid_y * self.face_size * self.scale
-            self.screen.blit(surface, (x, y))
+        # Scale up and draw the whole grid at once
+        if self.scale > 1:
+            pygame.transform.scale(self.atlas, self.screen.get_size(), self.screen)
+        else:
+            self.screen.blit(self.atlas, (0, 0))
 
-            # Draw face label
-            font = pygame.font.Font(None, 24)
-            text = font.render(name.upper(), True, (255, 255, 255))
-            text_rect = text.get_rect(center=(
-                x + (self.face_size * self.scale) // 2,
-                y + 10
-            ))
-            self.screen.blit(text, text_rect)
+        # Draw face labels
+        self.screen.blits(self.label_blits, doreturn=False)
 
         pygame.display.flip()
 
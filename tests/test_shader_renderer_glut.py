@@ -0,0 +1,44 @@
+"""Tests for GLUTShaderRenderer context handling."""
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("OpenGL.GLUT")
+
+from cube.shader import shader_renderer_glut
+from cube.shader.shader_renderer_glut import GLUTShaderRenderer
+
+
+def _renderer_recording_into(calls):
+    """Build a renderer without a GL context whose cleanup steps record into calls."""
+    renderer = GLUTShaderRenderer.__new__(GLUTShaderRenderer)
+    renderer.glut_window = 7
+    renderer.uniform_manager = mock.Mock()
+    renderer.readback = mock.Mock(release=lambda: calls.append("readback"))
+    renderer.program_cache = mock.Mock(release=lambda: calls.append("vertex shaders"))
+    renderer._purge_texture_cache = lambda: calls.append("textures")
+    renderer._delete_programs = lambda: calls.append("programs")
+    return renderer
+
+
+def test_cleanup_makes_own_window_current_first(monkeypatch):
+    calls = []
+    monkeypatch.setattr(shader_renderer_glut, "glutSetWindow",
+                        lambda window: calls.append(("window", window)))
+
+    renderer = _renderer_recording_into(calls)
+    renderer.cleanup()
+
+    assert calls == [("window", 7), "readback", "textures", "programs", "vertex shaders"]
+
+
+def test_cleanup_skips_gl_deletes_without_own_window(monkeypatch):
+    calls = []
+    renderer = _renderer_recording_into(calls)
+    renderer.glut_window = None
+
+    renderer.cleanup()
+
+    assert calls == []
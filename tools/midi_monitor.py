@@ -10,7 +10,7 @@ CC numbers your faders, knobs, and buttons send.
 """
 
 import sys
-import time
+import threading
 
 try:
     import rtmidi
@@ -20,6 +20,40 @@ except ImportError:
     sys.exit(1)
 
 
+def _print_note_off(channel, note, velocity):
+    print(f"Note {note:3d} OFF (channel {channel})")
+
+
+def _print_note_on(channel, note, velocity):
+    if velocity > 0:
+        print(f"Note {note:3d} ON  (velocity {velocity:3d}, channel {channel})")
+    else:
+        print(f"Note {note:3d} OFF (channel {channel})")
+
+
+def _print_control_change(channel, cc_number, cc_value):
+    print(f"CC {cc_number:3d} = {cc_value:3d}  (channel {channel})")
+
+
+# Message printers indexed by the status byte's high nibble (message type)
+_PRINTERS = [None] * 16
+_PRINTERS[0x8] = _print_note_off
+_PRINTERS[0x9] = _print_note_on
+_PRINTERS[0xB] = _print_control_change
+
+
+def print_message(message, data=None):
+    """Print one incoming MIDI message (rtmidi input callback)."""
+    midi_message, _delta_time = message
+
+    if len(midi_message) >= 3:
+        status, data1, data2 = midi_message[:3]
+        printer = _PRINTERS[status >> 4]
+        if printer is not None:
+            # Channels are 1-based for display
+            printer((status & 0x0F) + 1, data1, data2)
+
+
 def main():
     """Run MIDI monitor."""
     print("=" * 60)
@@ -69,47 +103,11 @@ def main():
         print(f"Failed to open MIDI port: {e}")
         return
 
-    # Monitor messages
+    # Monitor messages - rtmidi delivers them on its own thread
+    midi_in.set_callback(print_message)
     try:
-        while True:
-            message = midi_in.get_message()
-
-            if message:
-                midi_message, delta_time = message
-
-                if len(midi_message) >= 3:
-                    status = midi_message[0]
-                    data1 = midi_message[1]
-                    data2 = midi_message[2]
-
-                    # Check if this is a Control Change message (0xB0-0xBF)
-                    if (status & 0xF0) == 0xB0:
-                        channel = (status & 0x0F) + 1
-                        cc_number = data1
-                        cc_value = data2
-
-                        # Show message
-                        print(f"CC {cc_number:3d} = {cc_value:3d}  (channel {channel})")
-
-                    # Check if this is a Note On message (0x90-0x9F)
-                    elif (status & 0xF0) == 0x90:
-                        channel = (status & 0x0F) + 1
-                        note = data1
-                        velocity = data2
-
-                        if velocity > 0:
-                            print(f"Note {note:3d} ON  (velocity {velocity:3d}, channel {channel})")
-                        else:
-                            print(f"Note {note:3d} OFF (channel {channel})")
-
-                    # Check if this is a Note Off message (0x80-0x8F)
-                    elif (status & 0xF0) == 0x80:
-                        channel = (status & 0x0F) + 1
-                        note = data1
-                        print(f"Note {note:3d} OFF (channel {channel})")
-
-            time.sleep(0.01)
-
+        # Sleep until Ctrl-C instead of polling for messages
+        threading.Event().wait()
     except KeyboardInterrupt:
         print("\n" + "-" * 60)
         print("Monitoring stopped")